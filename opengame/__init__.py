@@ -3,6 +3,9 @@ import sys
 from . import version
 
 from .core.window import Window
+from .core.scene import Scene
+from .core.viewport import Camera2D
+from .core.assets import surfaces
 # Import .core.window will hide pygame support prompt
 from .core.widgets.sprite import Sprite
 from .core.widgets.background import Background
@@ -40,6 +43,6 @@ __all__ = ['Window', 'Sprite', 'Background', 'Label', 'Font', 'Bar', 'Color',
            'random', 'Pen', 'timer', 'translate', 'styles', 'math', 'MusicPlayer',
            'play_sound', 'screencap', 'Camera', 'WebView', 'recorder', 'cs',
            'version', 'GLWindow', 'RichText', 'Video', 'builtin', 'Entry', 'RectTool',
-           'Child', 'messagebox']
+           'Child', 'messagebox', 'Scene', 'Camera2D', 'surfaces']
 __version__ = version.get_string()
 timer.zero()
@@ -11,6 +11,10 @@ def main():
         if option in {'/?', '-h', '--help', 'help'}:
             print('Use "-v", "--version" or "version" to show the version.')
             print('Use "/?", "-h", "--help", "help" to show help.')
+            print('Use "bench" to run the benchmarks, "bench --help" for its options.')
+        if option == 'bench':
+            from .utils.bench import main as bench
+            bench(sys.argv[2:])
             
 
 if __name__ == '__main__':
@@ -0,0 +1,198 @@
+import os
+from collections import OrderedDict
+from weakref import WeakKeyDictionary, ref
+from typing import Optional, Tuple
+
+import pygame as pg
+
+from ..exceptions import OpenGameError
+
+__all__ = ['convert_modes', 'SurfaceCache', 'surfaces', 'load_image', 'TransformCache', 'transforms', 'get_mask',
+           'forget_mask']
+
+_OPAQUE = ('.jpg', '.jpeg', '.bmp')
+
+
+class convert_modes(object):
+    auto = 'auto'  # convert() for opaque JPG/BMP, convert_alpha() for images with transparency
+    alpha = 'alpha'  # Always convert_alpha(), rotated and scaled copies keep transparent corners
+    opaque = 'opaque'  # Always convert()
+    raw = 'raw'  # Keep the loaded pixel format
+
+
+def _convert(image: pg.Surface, path: str, mode: str):
+    if mode == convert_modes.raw or not pg.display.get_surface():
+        return image
+    if mode == convert_modes.auto:
+        if path.lower().endswith(_OPAQUE) and not image.get_flags() & pg.SRCALPHA:
+            mode = convert_modes.opaque
+        else:
+            mode = convert_modes.alpha
+    if mode == convert_modes.alpha:
+        return image.convert_alpha()
+    if mode != convert_modes.opaque:
+        raise OpenGameError(f'unknown convert mode {mode!r}')
+    colorkey = image.get_colorkey()
+    image = image.convert()
+    if colorkey is not None:
+        # Run-length encoding makes colorkeyed blits skip the transparent runs
+        image.set_colorkey(colorkey, pg.RLEACCEL)
+    return image
+
+
+class SurfaceCache(object):
+    # Surfaces are shared by every user, widgets copy them before drawing on them
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+        self.bytes = 0
+        self._surfaces = OrderedDict()  # (path, size, mode) -> surface, least recently used first
+
+    def __str__(self):
+        return f'SurfaceCache(entries={len(self)}, bytes={self.bytes}, hits={self.hits}, misses={self.misses})'
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    def load(self, path: str, size: Optional[Tuple[int, int]] = None, mode: str = convert_modes.auto):
+        path = os.path.abspath(path)
+        key = path, tuple(size) if size else None, mode
+        image = self._surfaces.get(key)
+        if image is not None:
+            self.hits += 1
+            self._surfaces.move_to_end(key)
+            return image
+        self.misses += 1
+        if size:
+            # The unscaled image is kept too, so other sizes of the same file are not decoded again
+            source = self._surfaces.get((path, None, mode))
+            if source is None:
+                source = self._store((path, None, mode), _convert(pg.image.load(path), path, mode))
+            return self._store(key, pg.transform.scale(source, key[1]))
+        return self._store(key, _convert(pg.image.load(path), path, mode))
+
+    def _store(self, key: tuple, image: pg.Surface):
+        self._surfaces[key] = image
+        self.bytes += image.get_pitch() * image.get_height()
+        self._evict()
+        return image
+
+    def _evict(self):
+        while self.max_bytes is not None and self.bytes > self.max_bytes and len(self._surfaces) > 1:
+            _, image = self._surfaces.popitem(last=False)
+            self.bytes -= image.get_pitch() * image.get_height()
+
+    def clear(self):
+        self._surfaces.clear()
+        self.bytes = 0
+        self.hits = self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {'entries': len(self), 'bytes': self.bytes, 'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0}
+
+
+surfaces = SurfaceCache()
+
+
+def load_image(path: str, size: Optional[Tuple[int, int]] = None, mode: str = convert_modes.auto):
+    return surfaces.load(path, size, mode)
+
+
+class TransformCache(object):
+    # Variants are always made from the untouched source, so repeated rotations never add blur.
+    # Sources are only referenced weakly, their variants are dropped together with them
+    def __init__(self, max_bytes: Optional[int] = 64 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.hits = self.misses = 0
+        self.bytes = 0
+        self._sources = {}  # id(source) -> (weak reference, {(angle, scale, flip_x, flip_y): surface})
+        self._surfaces = OrderedDict()  # (id(source), angle, scale, flip_x, flip_y) -> bytes, least recently used first
+
+    def __str__(self):
+        return f'TransformCache(entries={len(self)}, bytes={self.bytes}, hits={self.hits}, misses={self.misses})'
+
+    def __len__(self):
+        return len(self._surfaces)
+
+    @staticmethod
+    def quantize(angle: float, scale: float = 1, angle_step: float = 1):
+        # Nearby angles and scales share one surface, the steps bound how many variants exist
+        return round(angle / angle_step) * angle_step % 360, round(scale, 2)
+
+    def get(self, source: pg.Surface, angle: float = 0, scale: float = 1, flip: Tuple[bool, bool] = (False, False),
+            angle_step: float = 1):
+        angle, scale = self.quantize(angle, scale, angle_step)
+        flip_x, flip_y = flip
+        if not (angle or flip_x or flip_y) and scale == 1:
+            return source
+        ident = id(source)
+        variant = angle, scale, flip_x, flip_y
+        entry = self._sources.get(ident)
+        if entry is None:
+            entry = self._sources[ident] = ref(source, lambda _: self._forget(ident)), {}
+        image = entry[1].get(variant)
+        if image is not None:
+            self.hits += 1
+            self._surfaces.move_to_end((ident, *variant))
+            return image
+        self.misses += 1
+        image = pg.transform.flip(source, flip_x, flip_y) if flip_x or flip_y else source
+        if scale != 1:
+            image = pg.transform.rotozoom(image, angle, scale)
+        elif angle:
+            image = pg.transform.rotate(image, angle)
+        entry[1][variant] = image
+        size = image.get_pitch() * image.get_height()
+        self._surfaces[(ident, *variant)] = size
+        self.bytes += size
+        self._evict()
+        return image
+
+    def _forget(self, ident: int):
+        # Called when a source is garbage collected, before its id can be reused
+        _, variants = self._sources.pop(ident, (None, {}))
+        for variant in variants:
+            self.bytes -= self._surfaces.pop((ident, *variant), 0)
+
+    def _evict(self):
+        while self.max_bytes is not None and self.bytes > self.max_bytes and len(self._surfaces) > 1:
+            (ident, *variant), size = self._surfaces.popitem(last=False)
+            self.bytes -= size
+            del self._sources[ident][1][tuple(variant)]
+
+    def prebake(self, source: pg.Surface, buckets: int = 36, scale: float = 1, flip: Tuple[bool, bool] = (False, False)):
+        step = 360 / buckets
+        for index in range(buckets):
+            self.get(source, index * step, scale, flip, step)
+        return step
+
+    def clear(self):
+        self._sources.clear()
+        self._surfaces.clear()
+        self.bytes = 0
+        self.hits = self.misses = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {'entries': len(self), 'bytes': self.bytes, 'hits': self.hits, 'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0}
+
+
+transforms = TransformCache()
+
+_masks = WeakKeyDictionary()  # Surface -> mask, dropped together with the surface
+
+
+def get_mask(image: pg.Surface):
+    # Built on first use, cached surfaces and transform variants share their masks
+    mask = _masks.get(image)
+    if mask is None:
+        mask = _masks[image] = pg.mask.from_surface(image)
+    return mask
+
+
+def forget_mask(image: pg.Surface):
+    # Needed after drawing on a surface in place
+    _masks.pop(image, None)
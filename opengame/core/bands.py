@@ -0,0 +1,72 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+import pygame as pg
+
+__all__ = ['BandRenderer']
+
+
+def _draw_band(surface: pg.Surface, items: list, fill):
+    # pygame releases the GIL while filling and blitting, so bands are drawn in parallel
+    if fill is not None:
+        surface.fill(fill)
+    if items:
+        surface.blits(items, doreturn=False)
+
+
+class BandRenderer(object):
+    def __init__(self, window, bands: Optional[int] = None, threads: Optional[int] = None):
+        self.window = window
+        self.threads = threads or os.cpu_count() or 1
+        self.bands = bands or self.threads
+        self.pool = ThreadPoolExecutor(self.threads, 'opengame-render')
+        self._screen = None
+        self._surfaces = []
+
+    def __str__(self):
+        return f'BandRenderer(bands={self.bands}, threads={self.threads})'
+
+    def _split(self):
+        # Horizontal bands are subsurfaces, blits into them are clipped to the band
+        screen = self.window.screen
+        if screen is not self._screen:
+            width, height = screen.get_size()
+            bands = max(1, min(self.bands, height))
+            edges = [height * index // bands for index in range(bands + 1)]
+            self._surfaces = [
+                (screen.subsurface((0, top, width, bottom - top)), pg.Rect(0, top, width, bottom - top))
+                for top, bottom in zip(edges, edges[1:])
+            ]
+            self._screen = screen
+        return self._surfaces
+
+    def _draw(self, sprites: list, fill=None):
+        rects = [sprite.rect for sprite in sprites]
+        jobs = []
+        for surface, band in self._split():
+            top = band.top
+            # collidelistall keeps the sprite order, so overlapping sprites stack as on the full screen
+            items = [(sprites[index].image, rects[index].move(0, -top)) for index in band.collidelistall(rects)]
+            if items or fill is not None:
+                jobs.append(self.pool.submit(_draw_band, surface, items, fill))
+        for job in jobs:
+            job.result()
+
+    def render(self, runs: list, color=(255, 255, 255)):
+        # Blit-only runs are drawn band by band, other widgets draw alone in between, keeping the order
+        fill = color
+        sprites = []
+        for run in runs:
+            if type(run) is tuple:
+                sprites.extend(run)
+                continue
+            self._draw(sprites, fill)
+            fill = None
+            sprites = []
+            run.show()
+        if sprites or fill is not None:
+            self._draw(sprites, fill)
+
+    def shutdown(self):
+        self.pool.shutdown()
@@ -5,9 +5,10 @@ from pygame.math import Vector2, Vector3
 from opengame.exceptions import not_created_window
 from .saver import saver
 
-__all__ = ['CoordinateType', 'parse', 'to_pygame', 'to_opengame']
+__all__ = ['CoordinateType', 'parse', 'to_pygame', 'to_opengame', 'to_pygame_many', 'to_opengame_many', 'Transform']
 
 CoordinateType = Union[Tuple[Union[int, float], Union[int, float]], Sequence[Union[int, float]], complex, Vector2, Vector3]
+_PAIRS = (tuple, list)
 
 
 def parse(pos: CoordinateType):
@@ -21,17 +22,54 @@ def parse(pos: CoordinateType):
     return tuple(pos)
 
 
-def to_opengame(pos: CoordinateType):
-    x, y = parse(pos)
-    if not saver.window:
+class Transform(object):
+    # Cached on the window and replaced when its surface changes, so conversions only read two numbers
+    __slots__ = ('cx', 'cy')
+
+    def __init__(self, center: Tuple[int, int]):
+        self.cx, self.cy = center
+
+    def __str__(self):
+        return f'Transform(center=({self.cx}, {self.cy}))'
+
+    def to_pygame(self, pos: CoordinateType):
+        x, y = pos if type(pos) in _PAIRS else parse(pos)
+        return x + self.cx, self.cy - y
+
+    def to_opengame(self, pos: CoordinateType):
+        x, y = pos if type(pos) in _PAIRS else parse(pos)
+        return x - self.cx, self.cy - y
+
+    def to_pygame_many(self, points):
+        # Points are an array of shape (..., 2), the result is a new NumPy array
+        import numpy as np
+
+        return np.asarray(points) * (1, -1) + (self.cx, self.cy)
+
+    def to_opengame_many(self, points):
+        import numpy as np
+
+        return (np.asarray(points) - (self.cx, self.cy)) * (1, -1)
+
+
+def _transform():
+    window = saver.window
+    if not window:
         raise not_created_window
-    cx, cy = saver.window.screen_rect.center
-    return x - cx, -y + cy
+    return window.transform
+
+
+def to_opengame(pos: CoordinateType):
+    return _transform().to_opengame(pos)
 
 
 def to_pygame(pos: CoordinateType):
-    x, y = parse(pos)
-    if not saver.window:
-        raise not_created_window
-    cx, cy = saver.window.screen_rect.center
-    return x + cx, cy - y
+    return _transform().to_pygame(pos)
+
+
+def to_opengame_many(points):
+    return _transform().to_opengame_many(points)
+
+
+def to_pygame_many(points):
+    return _transform().to_pygame_many(points)
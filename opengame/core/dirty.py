@@ -0,0 +1,111 @@
+from typing import List
+
+import pygame as pg
+
+__all__ = ['DirtyRects']
+
+
+def _merge(rects: List[pg.Rect]):
+    merged = []
+    for rect in rects:
+        index = rect.collidelist(merged)
+        while index != -1:
+            rect = rect.union(merged.pop(index))
+            index = rect.collidelist(merged)
+        merged.append(rect)
+    return merged
+
+
+class DirtyRects(object):
+    # Widgets mark their rect before and after every move or image change, nothing is polled per frame.
+    # Code changing a rect in place, instead of through pos, x, y or the widget methods, must mark it too
+    def __init__(self, window):
+        self.window = window
+        self.enabled = False
+        self.full = True
+        self.painting = False
+        self.rects = []  # Regions to repaint on the next frame
+        self.drawn = []  # Regions drawn directly (Pen, when_draw) on this frame
+        self._sprites = None  # Registry snapshot of the last repaint
+        self._volatile = ()
+
+    def enable(self, enabled: bool = True):
+        self.enabled = enabled
+        self.full = True
+        self._sprites = None
+        self.rects.clear()
+        self.drawn.clear()
+
+    def reset(self):
+        # After a frame presented in full, the next dirty frame starts with a full repaint
+        self.full = True
+        self.drawn.clear()
+
+    def mark(self, rect):
+        if self.enabled:
+            self.rects.append(pg.Rect(rect))
+
+    def mark_drawn(self, rect):
+        if self.enabled and not self.painting:
+            self.drawn.append(pg.Rect(rect))
+
+    def _sync(self, sprites: tuple):
+        # Only runs when the registry changed, packed and removed sprites are repainted
+        old = self._sprites or ()
+        added, removed = set(sprites).difference(old), set(old).difference(sprites)
+        if old and not (added or removed):
+            self.full = True  # Same sprites in a new order, the overlaps may differ
+        for sprite in added | removed:
+            self.rects.append(pg.Rect(sprite.rect))
+        # Image-less widgets (Bar, Entry) draw custom content, they are repainted every frame
+        self._volatile = tuple(sprite for sprite in sprites if getattr(sprite, 'image', None) is None)
+        self._sprites = sprites
+
+    def repaint(self, sprites: tuple, color=(255, 255, 255)):
+        screen = self.window.screen
+        if sprites is not self._sprites:
+            self._sync(sprites)
+        if self.full:
+            self.full = False
+            self.rects.clear()
+            screen.fill(color)
+            self.painting = True
+            for sprite in sprites:
+                sprite.show()
+            self.painting = False
+            self.rects.append(self.window.screen_rect.copy())
+            return
+
+        for sprite in self._volatile:
+            self.rects.append(pg.Rect(sprite.rect))
+        shown = set()
+        if self.rects:
+            screen_rect = self.window.screen_rect
+            areas = [area.clip(screen_rect) for area in _merge(self.rects)]
+            self.rects = [area for area in areas if area.w and area.h]
+            rects = [sprite.rect for sprite in sprites]
+            self.painting = True
+            for area in self.rects:
+                screen.set_clip(area)
+                screen.fill(color)
+                for index in area.collidelistall(rects):
+                    sprites[index].show()
+                    shown.add(index)
+            screen.set_clip(None)
+            self.painting = False
+
+        # Sprites outside the repainted regions still take clicks, like the batched sprites of a full repaint
+        event = self.window._raw_event
+        if event is not None and event.type == pg.MOUSEBUTTONDOWN:
+            for index, sprite in enumerate(sprites):
+                if index not in shown:
+                    check_click = getattr(sprite, 'check_click', None)
+                    if check_click:
+                        check_click()
+
+    def present(self):
+        if not self.window.headless:
+            pg.display.update(self.rects + self.drawn)
+        # Direct drawings must be cleared on the next frame
+        self.rects = self.drawn
+        self.drawn = []
@@ -0,0 +1,69 @@
+from typing import Callable, Any
+
+import pygame as pg
+from pygame.locals import *
+
+__all__ = ['Handlers']
+
+
+class Handlers(object):
+    # Shared by Window and Scene, both keep _handlers, _when_draw and _when_update
+    
+    def _add_handler(self, event_type: int, func: Callable[..., Any], with_event: bool):
+        # Handlers are kept in tuples, so they can be changed while dispatching
+        self._handlers[event_type] = self._handlers.get(event_type, ()) + ((func, with_event), )
+        self._handlers_changed()
+        return func
+    
+    def _handlers_changed(self):
+        pass
+        
+    def subscribe(self, event_type: int, func: Callable[[pg.event.Event], Any]):
+        return self._add_handler(event_type, func, True)
+    
+    def unsubscribe(self, event_type: int, func: Callable[..., Any]):
+        handlers = tuple(handler for handler in self._handlers.get(event_type, ()) if handler[0] is not func)
+        if handlers:
+            self._handlers[event_type] = handlers
+        else:
+            self._handlers.pop(event_type, None)
+        self._handlers_changed()
+    
+    def when_mouse_down(self, func: Callable[[], Any]):
+        return self._add_handler(MOUSEBUTTONDOWN, func, False)
+
+    def when_mouse_up(self, func: Callable[[], Any]):
+        return self._add_handler(MOUSEBUTTONUP, func, False)
+
+    def when_mouse_move(self, func: Callable[[], Any]):
+        return self._add_handler(MOUSEMOTION, func, False)
+
+    def when_key_down(self, func: Callable[[], Any]):
+        return self._add_handler(KEYDOWN, func, False)
+
+    def when_key_up(self, func: Callable[[], Any]):
+        return self._add_handler(KEYUP, func, False)
+
+    def when_draw(self, func: Callable[[], Any]):
+        self._when_draw = func
+        return func
+        
+    def when_update(self, func: Callable[[], Any]):
+        self._when_update = func
+        return func
+
+    def when_resize(self, func: Callable[[], Any]):
+        return self._add_handler(VIDEORESIZE, func, False)
+
+    def when_active(self, func: Callable[[], Any]):
+        return self._add_handler(ACTIVEEVENT, func, False)
+        
+    set_mouse_down = when_mouse_down
+    set_mouse_up = when_mouse_up
+    set_mouse_move = when_mouse_move
+    set_key_down = when_key_down
+    set_key_up = when_key_up
+    set_draw = when_draw
+    set_update = when_update
+    set_resize = when_resize
+    set_active = when_active
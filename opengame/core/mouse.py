@@ -3,13 +3,22 @@ from typing import Union
 import pygame as pg
 
 from .coordinate import to_pygame, to_opengame, CoordinateType
+from .saver import saver
+
+
+def get_pos():
+    # Replayed sessions take the mouse position from the recorded events
+    window = saver.window
+    if window is not None and window.replay:
+        return window.replay.mouse_pos
+    return pg.mouse.get_pos()
 
 
 class Mouse(object):
     
     @property
     def pos(self):
-        return to_opengame(pg.mouse.get_pos())
+        return to_opengame(get_pos())
     
     @pos.setter
     def pos(self, pos: CoordinateType):
@@ -0,0 +1,163 @@
+import time
+from collections import deque
+
+import pygame as pg
+
+__all__ = ['Pacer', 'modes']
+
+# Rates the adaptive target steps through when the game cannot keep up
+_RATES = (360, 240, 165, 144, 120, 100, 90, 75, 60, 50, 45, 40, 30, 25, 20, 15, 10)
+# Events that end an idle wait at once
+_WAKE_EVENTS = (pg.WINDOWFOCUSGAINED, pg.WINDOWRESTORED, pg.WINDOWSHOWN, pg.QUIT)
+
+
+class modes(object):
+    tick = 'tick'  # clock.tick, sleeps with millisecond granularity
+    busy = 'busy'  # clock.tick_busy_loop, precise but keeps a core busy
+    hybrid = 'hybrid'  # Sleep until shortly before the deadline, then spin
+
+
+class Pacer(object):
+    def __init__(self, window, mode: str = modes.tick, frame_skip: bool = False, max_skip: int = 2,
+                 adaptive: bool = False, min_fps: float = 30, patience: int = 30, history: int = 240,
+                 spin: float = 0.002):
+        self.window = window
+        self.mode = mode
+        self.frame_skip = frame_skip
+        self.max_skip = max_skip
+        self.adaptive = adaptive
+        self.min_fps = min_fps
+        self.patience = patience
+        self.spin = spin
+        self.history = deque(maxlen=history)  # Whole frame times in milliseconds
+        self.work = deque(maxlen=history)  # Frame times without waiting, in milliseconds
+        self.target = None  # Adaptive FPS target, None means window.fps
+        self.skip = False  # Whether the next frame skips rendering
+        self.skipped = 0
+        self._skips = 0
+        self._behind = 0.0
+        self._over = self._under = 0
+        self._deadline = None
+        self._frame_start = self._work_start = time.perf_counter()
+
+    def __str__(self):
+        return f'Pacer(mode={self.mode}, fps={self.fps}, skipped={self.skipped})'
+
+    @property
+    def fps(self):
+        window = self.window
+        if window.background_fps and window.idle:
+            return window.background_fps
+        if self.target and window.fps:
+            return min(self.target, window.fps)
+        return window.fps
+
+    def reset(self):
+        self.target = None
+        self.skip = False
+        self._skips = 0
+        self._behind = 0.0
+        self._over = self._under = 0
+        self._deadline = None
+        self._frame_start = self._work_start = time.perf_counter()
+
+    def rest(self):
+        # Called after the loop blocked on purpose, so the wait is not taken for work
+        self._work_start = time.perf_counter()
+
+    def load(self, frames: int = 30):
+        # Mean work time of the last frames as a fraction of the frame budget
+        fps = self.fps
+        if not fps or not self.work:
+            return 0.0
+        work = list(self.work)[-frames:]
+        return sum(work) / len(work) * fps / 1000
+
+    def _idle_wait(self, deadline: float):
+        # Sleeps in short slices, so getting focus back resumes the game without waiting out the frame
+        while True:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            time.sleep(min(remaining, 0.02))
+            pg.event.pump()
+            if pg.event.peek(_WAKE_EVENTS):
+                break
+
+    def _sleep_until(self, deadline: float):
+        remaining = deadline - time.perf_counter()
+        if remaining > self.spin:
+            time.sleep(remaining - self.spin)
+        while time.perf_counter() < deadline:
+            pass
+
+    def wait(self, tick: bool = True, tasks: bool = True):
+        fps = self.fps
+        now = time.perf_counter()
+        work = now - self._work_start
+        budget = 1 / fps if fps else 0.0
+        if tasks and len(self.window.scheduler):
+            # Background tasks use the rest of the frame and do not count as work,
+            # without a deadline to wait for they still advance one step per frame
+            if tick:
+                self.window.scheduler.run(self._frame_start + budget)
+            else:
+                self.window.scheduler.run(now, 1)
+        if tick:
+            clock = self.window.clock
+            if self.window.background_fps and self.window.idle:
+                self._idle_wait(self._frame_start + budget)
+                clock.tick()
+            elif self.mode == modes.busy:
+                clock.tick_busy_loop(fps)
+            elif self.mode == modes.hybrid and fps:
+                # A late frame moves the deadline instead of rushing the following frames
+                self._deadline = max((self._deadline or now) + budget, now)
+                self._sleep_until(self._deadline)
+                clock.tick()
+            else:
+                clock.tick(fps)
+        end = time.perf_counter()
+        self.history.append((end - self._frame_start) * 1000)
+        self.work.append(work * 1000)
+        self._frame_start = self._work_start = end
+        if budget:
+            rendered = not self.skip  # Skipped frames are cheap and say nothing about the load
+            self._update_skip(work, budget)
+            if self.adaptive and rendered:
+                self._adapt(work, budget)
+
+    def _update_skip(self, work: float, budget: float):
+        # At most max_skip frames in a row skip rendering, then one is always drawn
+        self._behind = max(0.0, self._behind + work - budget)
+        if self.frame_skip and self._behind > budget and self._skips < self.max_skip:
+            self.skip = True
+            self._skips += 1
+            self.skipped += 1
+        else:
+            self.skip = False
+            self._skips = 0
+
+    def _adapt(self, work: float, budget: float):
+        fps = self.fps
+        if work > budget:
+            self._over += 1
+            self._under = 0
+        elif work < budget * 0.6:
+            self._under += 1
+            self._over = 0
+        else:
+            self._over = self._under = 0
+
+        if self._over >= self.patience:
+            lower = [rate for rate in _RATES if rate < fps]
+            if lower and lower[0] >= self.min_fps:
+                self.target = lower[0]
+            self._over = 0
+        elif self._under >= self.patience * 4 and self.target:
+            higher = [rate for rate in _RATES if rate > fps]
+            if not higher or higher[-1] >= self.window.fps:
+                self.target = None
+            else:
+                self.target = higher[-1]
+            self._under = 0
@@ -0,0 +1,100 @@
+import json
+from time import perf_counter_ns
+from collections import deque
+from typing import Callable, Any, Dict
+
+__all__ = ['Profiler']
+
+
+def _percentile(values: list, percent: float):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+class Profiler(object):
+    def __init__(self, window, overlay: bool = False, history: int = 600, max_events: int = 100000):
+        self.window = window
+        self.overlay = overlay
+        self.history = history
+        self.frames = deque(maxlen=history)  # Frame times in milliseconds
+        self.phases: Dict[str, deque] = {}
+        self.events = deque(maxlen=max_events)  # Chrome trace events
+        self._origin = perf_counter_ns()
+        self._frame_start = self._last = self._origin
+        self._label = None
+
+    def __str__(self):
+        stats = self.stats()
+        return (f'Profiler(p50={stats["p50"]:.2f}ms, p95={stats["p95"]:.2f}ms, '
+                f'p99={stats["p99"]:.2f}ms, fps={stats["fps"]:.1f})')
+
+    def _record(self, name: str, start: int, end: int, category: str):
+        self.events.append({
+            'name': name, 'cat': category, 'ph': 'X', 'pid': 0, 'tid': 0,
+            'ts': (start - self._origin) / 1000, 'dur': (end - start) / 1000,
+        })
+
+    def _store(self, name: str, duration: int):
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = deque(maxlen=self.history)
+        phase.append(duration / 1e6)
+
+    def start_frame(self):
+        self._frame_start = self._last = perf_counter_ns()
+
+    def lap(self, name: str):
+        now = perf_counter_ns()
+        self._record(name, self._last, now, 'phase')
+        self._store(name, now - self._last)
+        self._last = now
+
+    def end_frame(self):
+        now = perf_counter_ns()
+        self._record('frame', self._frame_start, now, 'frame')
+        self.frames.append((now - self._frame_start) / 1e6)
+
+    def call(self, name: str, func: Callable[..., Any], *args):
+        start = perf_counter_ns()
+        try:
+            return func(*args)
+        finally:
+            end = perf_counter_ns()
+            self._record(name, start, end, 'handler')
+            self._store(name, end - start)
+
+    def stats(self):
+        frames = list(self.frames)
+        mean = sum(frames) / len(frames) if frames else 0.0
+        return {
+            'frames': len(frames),
+            'mean': mean,
+            'p50': _percentile(frames, 50),
+            'p95': _percentile(frames, 95),
+            'p99': _percentile(frames, 99),
+            'fps': 1000 / mean if mean else 0.0,
+            'phases': {name: sum(values) / len(values) for name, values in self.phases.items() if values},
+        }
+
+    def dump(self, file: str = 'profile.json'):
+        with open(file, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': list(self.events), 'displayTimeUnit': 'ms'}, f)
+        return file
+
+    def reset(self):
+        self.frames.clear()
+        self.phases.clear()
+        self.events.clear()
+
+    def draw_overlay(self):
+        if self._label is None:
+            from .widgets.label import Label, Font
+            self._label = Label(font=Font(None, 20), color=(255, 0, 0))
+        if self.window.counter % 30 == 0:
+            stats = self.stats()
+            self._label.set_text(f'{stats["fps"]:.0f} FPS  p50 {stats["p50"]:.1f}  '
+                                 f'p95 {stats["p95"]:.1f}  p99 {stats["p99"]:.1f} ms')
+            self._label.rect.topleft = 4, 4
+        self._label.show()
@@ -0,0 +1,167 @@
+from bisect import insort
+from typing import Optional, Type
+
+import pygame as pg
+
+__all__ = ['SpriteRegistry']
+_blit_only = {}
+
+
+def _is_blit_only(cls: type):
+    # A widget class sets blit_only when its show() only blits image at rect, the window may then batch it.
+    # Only trust blit_only from the class that defines show(), subclasses overriding show() draw on their own
+    res = _blit_only.get(cls)
+    if res is None:
+        res = False
+        for klass in cls.__mro__:
+            if 'show' in vars(klass):
+                res = bool(vars(klass).get('blit_only', False))
+                break
+        _blit_only[cls] = res
+    return res
+
+
+class SpriteRegistry(pg.sprite.AbstractGroup):
+    def __init__(self, *sprites, default_layer: int = 0):
+        super().__init__()
+        self.default_layer = default_layer
+        self._layers = {}  # Layer -> dict of sprites, the dicts keep insertion order
+        self._order = []  # Sorted layer numbers
+        self._sprite_layers = {}
+        self._hidden_layers = set()
+        self._hidden = set()
+        self._cache = None
+        self._runs = None
+        self.add(*sprites)
+
+    def __str__(self):
+        return f'SpriteRegistry(sprites={len(self)}, layers={self._order})'
+
+    def __len__(self):
+        return len(self._sprite_layers)
+
+    def __iter__(self):
+        return iter(self.sprites())
+
+    def sprites(self):
+        # The snapshot is rebuilt after a change, so it can be iterated while sprites are added or removed
+        if self._cache is None:
+            hidden = self._hidden
+            self._cache = tuple(
+                sprite
+                for layer in self._order if layer not in self._hidden_layers
+                for sprite in self._layers[layer] if sprite not in hidden
+            )
+        return self._cache
+
+    def runs(self):
+        # Consecutive blit-only sprites are grouped into tuples, other sprites are kept alone
+        sprites = self.sprites()
+        if self._runs is None or self._runs[0] is not sprites:
+            runs, run = [], []
+            for sprite in sprites:
+                if _is_blit_only(type(sprite)):
+                    run.append(sprite)
+                    continue
+                if run:
+                    runs.append(tuple(run))
+                    run = []
+                runs.append(sprite)
+            if run:
+                runs.append(tuple(run))
+            self._runs = sprites, runs
+        return self._runs[1]
+
+    def add_internal(self, sprite, layer: Optional[int] = None):
+        if layer is None:
+            layer = getattr(sprite, '_layer', self.default_layer)
+        elif hasattr(sprite, '_layer'):
+            sprite._layer = layer
+        sprites = self._layers.get(layer)
+        if sprites is None:
+            sprites = self._layers[layer] = {}
+            insort(self._order, layer)
+        sprites[sprite] = None
+        self._sprite_layers[sprite] = layer
+        self.spritedict[sprite] = None
+        self._cache = None
+
+    def remove_internal(self, sprite):
+        layer = self._sprite_layers.pop(sprite)
+        del self._layers[layer][sprite]
+        del self.spritedict[sprite]
+        self._hidden.discard(sprite)
+        self._cache = None
+
+    def add(self, *sprites, layer: Optional[int] = None):
+        for sprite in sprites:
+            if isinstance(sprite, pg.sprite.Sprite):
+                if not self.has_internal(sprite):
+                    self.add_internal(sprite, layer)
+                    sprite.add_internal(self)
+            elif layer is None and isinstance(sprite, pg.sprite.LayeredUpdates):
+                for spr in sprite.sprites():
+                    self.add(spr, layer=sprite.get_layer_of_sprite(spr))
+            else:
+                self.add(*sprite, layer=layer)
+
+    append = add
+
+    def empty(self):
+        self.remove(*list(self._sprite_layers))
+
+    def layers(self):
+        return list(self._order)
+
+    def get_layer_of_sprite(self, sprite):
+        return self._sprite_layers.get(sprite, self.default_layer)
+
+    def get_sprites_from_layer(self, layer: int):
+        return list(self._layers.get(layer, ()))
+
+    def change_layer(self, sprite, layer: int):
+        if self._sprite_layers.get(sprite) == layer:
+            return
+        hidden = sprite in self._hidden
+        self.remove_internal(sprite)
+        self.add_internal(sprite, layer)
+        if hidden:
+            self._hidden.add(sprite)
+
+    def move_to_front(self, sprite):
+        sprites = self._layers[self._sprite_layers[sprite]]
+        del sprites[sprite]
+        sprites[sprite] = None
+        self._cache = None
+
+    def move_to_back(self, sprite):
+        layer = self._sprite_layers[sprite]
+        sprites = self._layers[layer]
+        del sprites[sprite]
+        self._layers[layer] = {sprite: None, **sprites}
+        self._cache = None
+
+    def set_visible(self, sprite, visible: bool = True):
+        if visible:
+            self._hidden.discard(sprite)
+        elif sprite in self._sprite_layers:
+            self._hidden.add(sprite)
+        self._cache = None
+
+    def is_visible(self, sprite):
+        return (sprite in self._sprite_layers and sprite not in self._hidden
+                and self._sprite_layers[sprite] not in self._hidden_layers)
+
+    def set_layer_visible(self, layer: int, visible: bool = True):
+        if visible:
+            self._hidden_layers.discard(layer)
+        else:
+            self._hidden_layers.add(layer)
+        self._cache = None
+
+    def to_group(self, group_type: Type[pg.sprite.LayeredUpdates] = pg.sprite.LayeredUpdates):
+        group = group_type()
+        for layer in self._order:
+            for sprite in self._layers[layer]:
+                group.add(sprite, layer=layer)
+        return group
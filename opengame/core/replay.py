@@ -0,0 +1,119 @@
+import atexit
+import marshal
+import random
+import struct
+from collections import defaultdict
+from typing import Optional, List
+
+import pygame as pg
+
+from ..exceptions import OpenGameError
+
+__all__ = ['InputRecorder', 'InputReplay']
+
+_MAGIC = b'OGIN'
+_VERSION = 1
+_HEADER = struct.Struct('<4sBQ')
+_RECORD = struct.Struct('<IHI')  # Frame, event type, payload length
+_SIMPLE = (int, float, str, bool, bytes, type(None))
+_END = pg.NOEVENT  # Type of the record marking the last frame of the session
+_FRAME_TIME = 0xFFFF  # Type of the records holding the elapsed time of fixed update frames
+
+
+def _simple(value):
+    if isinstance(value, tuple):
+        return all(_simple(item) for item in value)
+    return isinstance(value, _SIMPLE)
+
+
+class InputRecorder(object):
+    def __init__(self, file: str, start: int = 0, seed: Optional[int] = None):
+        if seed is None:
+            seed = random.getrandbits(63)
+        random.seed(seed)
+        self.file = file
+        self.seed = seed
+        self.start = start
+        self.count = 0
+        self.frame = -1  # Last frame written, relative to start
+        self._file = open(file, 'wb')
+        self._file.write(_HEADER.pack(_MAGIC, _VERSION, seed))
+        atexit.register(self.close)
+
+    def __str__(self):
+        return f'InputRecorder(file={self.file}, seed={self.seed}, events={self.count})'
+
+    def write(self, frame: int, events: List[pg.event.Event]):
+        write = self._file.write
+        frame -= self.start
+        self.frame = frame
+        for event in events:
+            # Window handles and other objects cannot be replayed, only plain values are kept
+            payload = marshal.dumps({key: value for key, value in event.dict.items() if _simple(value)})
+            write(_RECORD.pack(frame, event.type, len(payload)))
+            write(payload)
+        self.count += len(events)
+
+    def write_frame_time(self, frame: int, elapsed: float):
+        # Fixed update steps depend on the wall clock, the replay feeds the recorded times back
+        payload = marshal.dumps(elapsed)
+        self._file.write(_RECORD.pack(frame - self.start, _FRAME_TIME, len(payload)))
+        self._file.write(payload)
+
+    def close(self):
+        if not self._file.closed:
+            # Frames after the last input still belong to the session, the replay runs up to this one
+            if self.frame >= 0:
+                self._file.write(_RECORD.pack(self.frame, _END, 0))
+            self._file.close()
+        atexit.unregister(self.close)
+
+
+class InputReplay(object):
+    def __init__(self, file: str, start: int = 0):
+        self.file = file
+        self.start = start
+        self.frames = defaultdict(list)
+        self.frame_times = {}
+        self.mouse_pos = (0, 0)
+        with open(file, 'rb') as f:
+            data = f.read()
+        magic, version, self.seed = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise OpenGameError(f'{file} is not an OpenGame input log')
+        offset = _HEADER.size
+        self.count = 0
+        end = -1
+        while offset < len(data):
+            frame, event_type, length = _RECORD.unpack_from(data, offset)
+            offset += _RECORD.size
+            if event_type == _END:
+                end = frame
+                continue
+            attributes = marshal.loads(data[offset:offset + length])
+            offset += length
+            if event_type == _FRAME_TIME:
+                self.frame_times[frame] = attributes
+                continue
+            self.frames[frame].append(pg.event.Event(event_type, attributes))
+            self.count += 1
+        # Logs without the end record stop after the last input frame
+        self.last = max(end, max(self.frames, default=-1), max(self.frame_times, default=-1))
+        random.seed(self.seed)
+
+    def __str__(self):
+        return f'InputReplay(file={self.file}, seed={self.seed}, events={self.count})'
+
+    def done(self, frame: int):
+        return frame - self.start > self.last
+
+    def frame_time(self, frame: int):
+        return self.frame_times.pop(frame - self.start, 0.0)
+
+    def get(self, frame: int):
+        events = self.frames.pop(frame - self.start, ())
+        for event in events:
+            pos = getattr(event, 'pos', None)
+            if pos is not None:
+                self.mouse_pos = pos
+        return events
@@ -0,0 +1,140 @@
+from typing import Optional, Callable, Any
+
+import pygame as pg
+
+from .saver import saver
+from .handlers import Handlers
+from .registry import SpriteRegistry
+from ..exceptions import not_created_window, OpenGameError
+
+__all__ = ['Scene', 'SceneStack']
+
+# Window attributes that belong to the active scene
+_STATE = ('sprites', '_handlers', '_when_draw', '_when_update')
+
+
+class Scene(Handlers):
+    def __init__(self, title: Optional[str] = None, window=None):
+        if window is None:
+            window = saver.window
+        if not window:
+            raise not_created_window
+        self.window = window
+        self.title = title
+        self.sprites = SpriteRegistry()
+        self.loaded = False
+        self._handlers = {}
+
+        _empty_func = lambda *args: None
+        self._when_draw = _empty_func
+        self._when_update = _empty_func
+        self._when_load = _empty_func
+        self._when_enter = _empty_func
+        self._when_exit = _empty_func
+
+    def __str__(self):
+        return f'Scene(title={self.title}, sprites={len(self.sprites)})'
+
+    def add(self, sprite, layer: Optional[int] = None):
+        self.sprites.add(sprite, layer=layer)
+
+    def when_load(self, func: Callable[[], Any]):
+        self._when_load = func
+        return func
+
+    def when_enter(self, func: Callable[[], Any]):
+        self._when_enter = func
+        return func
+
+    def when_exit(self, func: Callable[[], Any]):
+        self._when_exit = func
+        return func
+
+    def load(self):
+        # Widgets packed while loading go into this scene, even if another scene is shown
+        if self.loaded:
+            return self
+        self.loaded = True
+        window = self.window
+        sprites = window.sprites
+        window.sprites = self.sprites
+        try:
+            self._when_load()
+        finally:
+            if window.sprites is self.sprites:
+                window.sprites = sprites
+        return self
+
+    preload = load
+
+    def _handlers_changed(self):
+        if self.window._handlers is self._handlers:
+            self.window._handlers_changed()
+
+    def _activate(self):
+        window = self.window
+        for name in _STATE:
+            setattr(window, name, getattr(self, name))
+        window.dirty_rects.full = True
+        window._handlers_changed()
+        if self.title is not None:
+            pg.display.set_caption(self.title)
+
+    def _deactivate(self):
+        window = self.window
+        for name in _STATE:
+            setattr(self, name, getattr(window, name))
+
+
+class SceneStack(object):
+    def __init__(self, window):
+        self.window = window
+        self.root = Scene(pg.display.get_caption()[0], window)
+        self.root.loaded = True
+        for name in _STATE:
+            setattr(self.root, name, getattr(window, name))
+        self._stack = [self.root]
+
+    def __len__(self):
+        return len(self._stack)
+
+    def __iter__(self):
+        return iter(self._stack)
+
+    @property
+    def current(self):
+        return self._stack[-1]
+
+    def push(self, scene: Scene):
+        current = self.current
+        current._deactivate()
+        current._when_exit()
+        self._stack.append(scene)
+        scene.load()
+        scene._activate()
+        scene._when_enter()
+        return scene
+
+    def pop(self):
+        if len(self._stack) == 1:
+            raise OpenGameError('cannot pop the root scene')
+        current = self.current
+        current._deactivate()
+        current._when_exit()
+        self._stack.pop()
+        scene = self.current
+        scene._activate()
+        scene._when_enter()
+        return current
+
+    def replace(self, scene: Scene):
+        if len(self._stack) == 1:
+            return self.push(scene)
+        current = self.current
+        current._deactivate()
+        current._when_exit()
+        self._stack[-1] = scene
+        scene.load()
+        scene._activate()
+        scene._when_enter()
+        return current
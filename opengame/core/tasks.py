@@ -0,0 +1,111 @@
+import time
+import inspect
+from itertools import count
+from typing import Optional, Callable, Any, Union, Generator
+
+from ..exceptions import OpenGameError
+
+__all__ = ['BackgroundTask', 'BackgroundScheduler']
+
+
+class BackgroundTask(object):
+    def __init__(self, generator: Generator, priority: int = 0, name: Optional[str] = None):
+        self.generator = generator
+        self.priority = priority
+        self.name = name or getattr(generator, '__name__', 'task')
+        self.elapsed = 0.0  # Seconds spent in the generator
+        self.longest = 0.0  # Longest single step in seconds
+        self.steps = 0
+        self.frame = None  # Window frame of the last step
+        self.done = False
+        self.cancelled = False
+        self.result = None
+        self._order = 0
+        self._when_done = lambda result: None
+
+    def __str__(self):
+        return f'BackgroundTask(name={self.name}, priority={self.priority}, steps={self.steps}, done={self.done})'
+
+    def when_done(self, func: Callable[[Any], Any]):
+        self._when_done = func
+        if self.done and not self.cancelled:
+            func(self.result)
+        return func
+
+    def cancel(self):
+        if not self.done:
+            self.done = self.cancelled = True
+            self.generator.close()
+
+    def step(self, frame: int):
+        start = time.perf_counter()
+        try:
+            next(self.generator)
+        except StopIteration as res:
+            self.done = True
+            self.result = res.value
+        finally:
+            spent = time.perf_counter() - start
+            self.elapsed += spent
+            self.longest = max(self.longest, spent)
+            self.steps += 1
+            self.frame = frame
+        if self.done:
+            self._when_done(self.result)
+
+
+class BackgroundScheduler(object):
+    def __init__(self, window, starve_frames: int = 30):
+        self.window = window
+        self.starve_frames = starve_frames
+        self.tasks = []
+        self._order = count()
+
+    def __str__(self):
+        return f'BackgroundScheduler(tasks={len(self.tasks)})'
+
+    def __len__(self):
+        return len(self.tasks)
+
+    def add(self, generator_fn: Union[Callable[[], Generator], Generator], priority: int = 0,
+            name: Optional[str] = None):
+        generator = generator_fn if inspect.isgenerator(generator_fn) else generator_fn()
+        if not inspect.isgenerator(generator):
+            raise OpenGameError('background tasks must be generators')
+        task = BackgroundTask(generator, priority, name or getattr(generator_fn, '__name__', None))
+        task.frame = self.window.counter
+        self.tasks.append(task)
+        return task
+
+    def _step(self, task: BackgroundTask):
+        task._order = next(self._order)
+        try:
+            task.step(self.window.counter)
+        except BaseException:
+            task.done = True
+            raise
+        finally:
+            if task.done:
+                self.tasks.remove(task)
+
+    def run(self, deadline: float, min_steps: int = 0):
+        # Tasks that waited too long get one step even without time left, so low priorities still finish
+        self.tasks = [task for task in self.tasks if not task.done]
+        frame = self.window.counter
+        for task in [task for task in self.tasks if frame - task.frame >= self.starve_frames]:
+            self._step(task)
+        steps = 0
+        while self.tasks and (steps < min_steps or time.perf_counter() < deadline):
+            # Higher priorities first, equal priorities take turns
+            self._step(max(self.tasks, key=lambda task: (task.priority, -task._order)))
+            steps += 1
+
+    def cancel_all(self):
+        for task in self.tasks:
+            task.cancel()
+        self.tasks.clear()
+
+    def stats(self):
+        return [{'name': task.name, 'priority': task.priority, 'steps': task.steps,
+                 'elapsed_ms': task.elapsed * 1000, 'longest_ms': task.longest * 1000}
+                for task in self.tasks]
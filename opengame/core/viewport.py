@@ -0,0 +1,152 @@
+from collections import OrderedDict
+from typing import Tuple
+from weakref import WeakKeyDictionary, WeakSet
+
+import pygame as pg
+
+from .saver import saver
+from .coordinate import CoordinateType, parse
+from ..exceptions import not_created_window, OpenGameError
+
+__all__ = ['Camera2D']
+
+
+class Camera2D(object):
+    # Sprite rects hold world positions, the camera maps them onto the screen when the window renders.
+    # Fixed sprites, and widgets drawing in their own show(), stay in screen space.
+
+    def __init__(self, pos: CoordinateType = (0, 0), zoom: float = 1, window=None, cached_zooms: int = 4):
+        if window is None:
+            window = saver.window
+        if not window:
+            raise not_created_window
+        self.window = window
+        self.x, self.y = parse(pos)
+        self._zoom = 1
+        self.zoom = zoom
+        self.cached_zooms = cached_zooms
+        self.fixed = WeakSet()
+        self.drawn = 0  # Sprites drawn on the last frame, the rest were culled
+        self._images = OrderedDict()  # Zoom -> {image: scaled image}, least recently used first
+
+    def __str__(self):
+        return f'Camera2D(pos=({self.x}, {self.y}), zoom={self.zoom})'
+
+    @property
+    def pos(self):
+        return self.x, self.y
+
+    @pos.setter
+    def pos(self, pos: CoordinateType):
+        self.x, self.y = parse(pos)
+
+    @property
+    def zoom(self):
+        return self._zoom
+
+    @zoom.setter
+    def zoom(self, zoom: float):
+        if zoom <= 0:
+            raise OpenGameError('zoom must be positive')
+        self._zoom = zoom
+
+    def move(self, dx: float, dy: float):
+        self.x += dx
+        self.y += dy
+
+    def fix(self, *sprites: pg.sprite.Sprite):
+        self.fixed.update(sprites)
+
+    def unfix(self, *sprites: pg.sprite.Sprite):
+        for sprite in sprites:
+            self.fixed.discard(sprite)
+
+    def look_at(self, sprite: pg.sprite.Sprite):
+        cx, cy = self.window.transform.cx, self.window.transform.cy
+        self.x, self.y = sprite.rect.centerx - cx, cy - sprite.rect.centery
+
+    def view(self):
+        # The part of the world on screen, in the pixel coordinates sprite rects use
+        width, height = self.window.screen_rect.size
+        left, top = self.to_world((0, 0))
+        return pg.Rect(int(left), int(top), int(width / self._zoom) + 2, int(height / self._zoom) + 2)
+
+    def to_screen(self, pos: Tuple[float, float]):
+        transform = self.window.transform
+        zoom = self._zoom
+        return ((pos[0] - transform.cx - self.x) * zoom + transform.cx,
+                (pos[1] - transform.cy + self.y) * zoom + transform.cy)
+
+    def to_world(self, pos: Tuple[float, float]):
+        transform = self.window.transform
+        zoom = self._zoom
+        return ((pos[0] - transform.cx) / zoom + transform.cx + self.x,
+                (pos[1] - transform.cy) / zoom + transform.cy - self.y)
+
+    @property
+    def mouse_pos(self):
+        from .mouse import get_pos
+
+        x, y = self.to_world(get_pos())
+        transform = self.window.transform
+        return x - transform.cx, transform.cy - y
+
+    def scaled(self, image: pg.Surface, zoom: float):
+        images = self._images.get(zoom)
+        if images is None:
+            images = self._images[zoom] = WeakKeyDictionary()
+            while len(self._images) > self.cached_zooms:
+                self._images.popitem(last=False)
+        else:
+            self._images.move_to_end(zoom)
+        scaled = images.get(image)
+        if scaled is None:
+            width, height = image.get_size()
+            scaled = images[image] = pg.transform.scale(
+                image, (max(1, round(width * zoom)), max(1, round(height * zoom)))
+            )
+        return scaled
+
+    def blits(self, sprites: tuple):
+        # Only sprites intersecting the view are converted and drawn
+        rects = [sprite.rect for sprite in sprites]
+        visible = self.view().collidelistall(rects)
+        fixed = self.fixed
+        if fixed:
+            # Few sprites are fixed, so they are looked up in the run instead of testing every sprite
+            pinned = [sprites.index(sprite) for sprite in fixed if sprite in sprites]
+            if pinned:
+                visible = sorted(set(visible).union(pinned))
+        transform = self.window.transform
+        # A render scale shrinks the whole screen, fixed sprites included
+        scale = self.window.render_scale
+        zoom = self._zoom * scale
+        dx = (transform.cx - (transform.cx + self.x) * self._zoom) * scale
+        dy = (transform.cy - (transform.cy - self.y) * self._zoom) * scale
+        items = []
+        for index in visible:
+            sprite = sprites[index]
+            rect = rects[index]
+            if fixed and sprite in fixed:
+                if scale == 1:
+                    items.append((sprite.image, rect))
+                else:
+                    items.append((self.scaled(sprite.image, scale), (round(rect.x * scale), round(rect.y * scale))))
+            elif zoom == 1:
+                items.append((sprite.image, (rect.x + dx, rect.y + dy)))
+            else:
+                items.append((self.scaled(sprite.image, zoom), (round(rect.x * zoom + dx), round(rect.y * zoom + dy))))
+        self.drawn += len(items)
+        self.window.screen.blits(items, doreturn=False)
+
+    def render(self, runs: list, color=(255, 255, 255)):
+        self.drawn = 0
+        self.window.screen.fill(color)
+        for run in runs:
+            if type(run) is tuple:
+                self.blits(run)
+            else:
+                run.show()
+
+    def clear_cache(self):
+        self._images.clear()
@@ -1,21 +1,28 @@
-from typing import Tuple
+from typing import Optional, Tuple, Union
 
 import pygame as pg
 
 from ..saver import saver
 from ...exceptions import not_created_window
 from ..coordinate import to_pygame, to_opengame
+from ..assets import load_image
 
 
 class Background(pg.sprite.Sprite):
-    def __init__(self, image: str):
+    blit_only = True
+    
+    def __init__(self, image: Union[str, pg.Surface]):
         if not saver.window:
             raise not_created_window
         super().__init__()
         self.window = saver.window
         self.screen_rect = self.window.screen_rect
         self.path = image
-        self.image = pg.transform.scale(pg.image.load(image), self.screen_rect.size).convert_alpha()
+        if isinstance(image, pg.Surface):
+            self.image = pg.transform.scale(image, self.screen_rect.size).convert_alpha()
+        else:
+            # Opaque JPG and BMP files are converted without alpha, which blits faster
+            self.image = load_image(image, self.screen_rect.size).copy()
         self.rect = self.image.get_rect()
         
     def __copy__(self):
@@ -35,7 +42,10 @@ class Background(pg.sprite.Sprite):
 
     @pos.setter
     def pos(self, pos: Tuple[int, int]):
+        mark = self.window.dirty_rects.mark
+        mark(self.rect)
         self.rect.centerx, self.rect.centery = to_pygame(pos)
+        mark(self.rect)
 
     @property
     def x(self):
@@ -53,8 +63,8 @@ class Background(pg.sprite.Sprite):
     def y(self, y: int):
         self.pos = self.x, y
 
-    def pack(self):
-        self.window.add(self)
+    def pack(self, layer: Optional[int] = None):
+        self.window.add(self, layer)
 
     def unpack(self):
         self.window.sprites.remove(self)
@@ -64,30 +74,42 @@ class Background(pg.sprite.Sprite):
         y += speed
         if y > self.screen_rect.height:
             y = -self.screen_rect.height
+        mark = self.window.dirty_rects.mark
+        mark(self.rect)
         self.rect.x, self.rect.y = x, y
+        mark(self.rect)
 
     def scroll_up(self, speed=4):
         x, y = self.rect.x, self.rect.y
         y -= speed
         if y < -self.screen_rect.height:
             y = self.screen_rect.height
+        mark = self.window.dirty_rects.mark
+        mark(self.rect)
         self.rect.x, self.rect.y = x, y
+        mark(self.rect)
 
     def scroll_left(self, speed=4):
         x, y = self.rect.x, self.rect.y
         x -= speed
         if x < -self.screen_rect.width:
             x = self.screen_rect.width
+        mark = self.window.dirty_rects.mark
+        mark(self.rect)
         self.rect.x, self.rect.y = x, y
+        mark(self.rect)
 
     def scroll_right(self, speed=4):
         x, y = self.rect.x, self.rect.y
         x += speed
         if x > self.screen_rect.width:
             x = -self.screen_rect.width
+        mark = self.window.dirty_rects.mark
+        mark(self.rect)
         self.rect.x, self.rect.y = x, y
+        mark(self.rect)
         
     def show(self):
-        self.window.screen.blit(self.image, self.rect)
+        self.window.dirty_rects.mark_drawn(self.window.blit(self.image, self.rect))
         
     update = show
@@ -1,4 +1,4 @@
-from typing import Tuple
+from typing import Optional, Tuple
 
 import pygame as pg
 
@@ -33,6 +33,7 @@ class Bar(pg.sprite.Sprite):
         self.rect_border = pg.rect.Rect(self.realx, self.realy, self.width, self.height)
         self.rect_bar = pg.rect.Rect(self.realx, self.realy, self.width * self.proportion, self.height)
         self.rect = self.rect_border
+        self.window.invalidate()
 
     @property
     def pos(self):
@@ -61,15 +62,18 @@ class Bar(pg.sprite.Sprite):
     def y(self, y: int):
         self.pos = self.x, y
 
-    def pack(self):
-        self.window.add(self)
+    def pack(self, layer: Optional[int] = None):
+        self.window.add(self, layer)
 
     def unpack(self):
         self.window.sprites.remove(self)
         
     def show(self):
-        pg.draw.rect(self.screen, self.bar_color, self.rect_bar)
-        pg.draw.rect(self.screen, self.border_color, self.rect_border, width=self.border_width)
+        window = self.window
+        border_width = max(1, round(self.border_width * window.render_scale)) if self.border_width else 0
+        pg.draw.rect(window.screen, self.bar_color, window.canvas_rect(self.rect_bar))
+        pg.draw.rect(window.screen, self.border_color, window.canvas_rect(self.rect_border), width=border_width)
+        self.window.dirty_rects.mark_drawn(self.rect_border)
 
     def set_proportion(self, proportion: float):
         if proportion < 0:
@@ -8,6 +8,8 @@ from ...exceptions import not_created_window, OpenGameError
 
 
 class Camera(pg.sprite.Sprite):
+    blit_only = True
+    
     def __init__(self, device: Optional[str] = None, size: Union[Tuple[int, int], List[int]] = (320, 180),
                  color_mode: str = 'RGB', auto_start: bool = False, backend: Optional[str] = None):
         if not saver.window:
@@ -49,8 +51,8 @@ class Camera(pg.sprite.Sprite):
         self.rect = pg.rect.Rect((0, 0), self.size)
         self.pos = 0, 0
 
-    def pack(self):
-        self.window.add(self)
+    def pack(self, layer: Optional[int] = None):
+        self.window.add(self, layer)
 
     def unpack(self):
         self.window.sprites.remove(self)
@@ -67,7 +69,10 @@ class Camera(pg.sprite.Sprite):
 
     @pos.setter
     def pos(self, pos: Tuple[int, int]):
+        mark = self.window.dirty_rects.mark
+        mark(self.rect)
         self.rect.centerx, self.rect.centery = to_pygame(pos)
+        mark(self.rect)
 
     @property
     def x(self):
@@ -121,8 +126,9 @@ class Camera(pg.sprite.Sprite):
                 err = OpenGameError(str(err))
                 raise err from None
             self.image = self.last
+        self.window.dirty_rects.mark(self.rect)
 
     def show(self):
-        self.window.screen.blit(self.image, self.rect)
+        self.window.dirty_rects.mark_drawn(self.window.blit(self.image, self.rect))
         
     update = show
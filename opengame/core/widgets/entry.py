@@ -25,6 +25,7 @@ class Entry(pg.sprite.Sprite):
         self.window = saver.window
         self.screen = self.window.screen
         self.screen_rect = self.window.screen_rect
+        self.window.keep_events(pg.KEYDOWN, pg.TEXTINPUT, pg.TEXTEDITING)
         
         self.rect = pg.Rect(0, 0, self.window.width, height)
         if width:
@@ -78,8 +79,8 @@ class Entry(pg.sprite.Sprite):
     def y(self, y: int):
         self.pos = self.x, y
         
-    def pack(self):
-        self.window.add(self)
+    def pack(self, layer: Optional[int] = None):
+        self.window.add(self, layer)
 
     def unpack(self):
         self.window.sprites.remove(self)
@@ -104,7 +105,13 @@ class Entry(pg.sprite.Sprite):
         return self.text
     
     def show(self):
-        pg.draw.rect(self.screen, self.background, self.rect)
+        window = self.window
+        if window.render_scale == 1:
+            screen, rect = window.screen, self.rect
+        else:
+            # Text is drawn at full size, then the field is scaled onto the canvas
+            screen, rect = pg.Surface(self.rect.size), pg.Rect((0, 0), self.rect.size)
+        pg.draw.rect(screen, self.background, rect)
         (key_down, text_editing, text_input, key, text, start, content) = self.window.entry_options()
 
         if key_down:
@@ -136,16 +143,19 @@ class Entry(pg.sprite.Sprite):
             self.text = self.text[:self.position] + content + self.text[self.position:]
             self.position += len(content)
 
-        start_pos = self.rect.copy()
+        start_pos = rect.copy()
         text_l = self.text[:self.position]
         text_m = self.editing_text[:self.editing_pos] + "|" + self.editing_text[self.editing_pos:]
         text_r = self.text[self.position:]
 
-        rect_textL = self.font.render_to(self.screen, start_pos, text_l, self.foreground)
+        rect_textL = self.font.render_to(screen, start_pos, text_l, self.foreground)
         start_pos.x += rect_textL.width
 
         text_m_rect = self.font.render_to(
-            self.screen, start_pos, text_m, self.foreground, None, ft.STYLE_UNDERLINE
+            screen, start_pos, text_m, self.foreground, None, ft.STYLE_UNDERLINE
         )
         start_pos.x += text_m_rect.width
-        self.font.render_to(self.screen, start_pos, text_r, self.foreground)
+        self.font.render_to(screen, start_pos, text_r, self.foreground)
+        if screen is not window.screen:
+            window.blit(screen, self.rect)
+        window.dirty_rects.mark_drawn(self.rect)
@@ -32,6 +32,8 @@ class Font(object):
 
 
 class Label(pg.sprite.Sprite):
+    blit_only = True
+    
     def __init__(self, text: str = '', font: Optional[Font] = None, antialias: bool = True,
                  color: ColorType = (0, 0, 0)):
         if not saver.window:
@@ -66,7 +68,10 @@ class Label(pg.sprite.Sprite):
 
     @pos.setter
     def pos(self, pos: Tuple[int, int]):
+        mark = self.window.dirty_rects.mark
+        mark(self.rect)
         self.rect.centerx, self.rect.centery = to_pygame(pos)
+        mark(self.rect)
 
     @property
     def x(self):
@@ -84,24 +89,27 @@ class Label(pg.sprite.Sprite):
     def y(self, y: int):
         self.pos = self.x, y
 
-    def pack(self):
-        self.window.add(self)
+    def pack(self, layer: Optional[int] = None):
+        self.window.add(self, layer)
 
     def unpack(self):
         self.window.sprites.remove(self)
         
     def set_text(self, text: str = ''):
+        mark = self.window.dirty_rects.mark
         if hasattr(self, 'rect'):
             x, y = self.rect.x, self.rect.y
+            mark(self.rect)
         else:
             x, y = self.screen_rect.center
         self.text = str(text)
         self.image = self.font.font.render(self.text, self.antialias, self.color)
         self.rect = self.image.get_rect()
         self.rect.x, self.rect.y = x, y
+        mark(self.rect)
         
     def show(self):
-        self.screen.blit(self.image, self.rect)
+        self.window.dirty_rects.mark_drawn(self.window.blit(self.image, self.rect))
         
     def save(self, file: str):
         pg.image.save(self.image, file)
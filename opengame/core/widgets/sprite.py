@@ -1,15 +1,19 @@
 import math
-from typing import Optional, Tuple, Callable, Any
+from typing import Optional, Tuple, Callable, Any, Union
 
 import pygame as pg
 
 from ..saver import saver
 from ..coordinate import to_pygame, to_opengame
+from ..mouse import get_pos
+from ..assets import load_image, convert_modes, transforms, get_mask, forget_mask
 from ...exceptions import not_created_window
 
 
 class Sprite(pg.sprite.Sprite):
-    def __init__(self, image: str, size: Optional[Tuple[int, int]] = None):
+    blit_only = True
+    
+    def __init__(self, image: Union[str, pg.Surface], size: Optional[Tuple[int, int]] = None):
         if not saver.window:
             raise not_created_window
         super().__init__()
@@ -17,11 +21,20 @@ class Sprite(pg.sprite.Sprite):
         self.screen = self.window.screen
         self.screen_rect = self.window.screen_rect
         self.path = image
+        self.size = size
         self.angle = 0
+        self.scale = 1
+        self.flipped = False, False
+        self.angle_step = 1  # Angles are rounded to this step, so rotated images can be cached
         
-        self.image = pg.image.load(image).convert_alpha()
-        if size:
-            self.image = pg.transform.scale(self.image, size)
+        if isinstance(image, pg.Surface):
+            self.image = image.convert_alpha()
+            if size:
+                self.image = pg.transform.scale(self.image, size)
+        else:
+            # The cache saves the decoding, each sprite still draws on its own copy
+            self.image = load_image(image, size, convert_modes.alpha).copy()
+        self.shared = False
         self.rect = self.image.get_rect()
         self.pos = 0, 0
         
@@ -32,10 +45,43 @@ class Sprite(pg.sprite.Sprite):
         return f'Sprite(image={self.path}, size={self.rect.size})'
 
     def __copy__(self):
-        sprite = Sprite(image=self.path, size=self.rect.size)
+        # The clone shares the image, drawing on either one in place changes both.
+        # edit_image() gives a sprite its own copy, call it before fill(), set_alpha() or pg.draw.
+        # __init__ is skipped, it would copy an image the clone does not keep
+        sprite = Sprite.__new__(Sprite)
+        pg.sprite.Sprite.__init__(sprite)
+        sprite.window, sprite.screen, sprite.screen_rect = self.window, self.screen, self.screen_rect
+        sprite.path, sprite.size = self.path, self.size
+        sprite.angle, sprite.scale, sprite.flipped, sprite.angle_step = self.angle, self.scale, self.flipped, self.angle_step
+        sprite.source, sprite._image = self.source, self._image
         sprite.rect = self.rect.copy()
-        sprite.image = self.image.copy()
+        sprite._when_click_me = lambda: None
+        sprite.shared = self.shared = True
         return sprite
+    
+    @property
+    def image(self):
+        return self._image
+    
+    @image.setter
+    def image(self, image: pg.Surface):
+        # A new image becomes the source that rotations and scaling start from
+        self._image = self.source = image
+        rect = getattr(self, 'rect', None)
+        if rect is not None:
+            self.window.dirty_rects.mark(rect)
+    
+    def edit_image(self):
+        # Edits of a rotated or scaled image are lost on the next transform, only the source is kept
+        if self.shared:
+            image = self._image.copy()
+            if self._image is self.source:
+                self.source = image
+            self._image = image
+            self.shared = False
+        forget_mask(self._image)
+        self.window.dirty_rects.mark(self.rect)
+        return self._image
 
     clone = copy = __copy__
     
@@ -45,49 +91,89 @@ class Sprite(pg.sprite.Sprite):
     
     @pos.setter
     def pos(self, pos: Tuple[int, int]):
+        mark = self.window.dirty_rects.mark
+        mark(self.rect)
         self.rect.centerx, self.rect.centery = to_pygame(pos)
+        mark(self.rect)
         
     @property
     def x(self):
-        return self.pos[0]
+        return self.rect.centerx - self.window.transform.cx
     
     @x.setter
     def x(self, x: int):
-        self.pos = x, self.y
+        mark = self.window.dirty_rects.mark
+        mark(self.rect)
+        self.rect.centerx = x + self.window.transform.cx
+        mark(self.rect)
 
     @property
     def y(self):
-        return self.pos[1]
+        return self.window.transform.cy - self.rect.centery
 
     @y.setter
     def y(self, y: int):
-        self.pos = self.x, y
+        mark = self.window.dirty_rects.mark
+        mark(self.rect)
+        self.rect.centery = self.window.transform.cy - y
+        mark(self.rect)
         
-    def pack(self):
-        self.window.add(self)
+    def pack(self, layer: Optional[int] = None):
+        self.window.add(self, layer)
         
     def unpack(self):
         self.window.sprites.remove(self)
         
+    def _transform(self):
+        self._image = transforms.get(self.source, self.angle, self.scale, self.flipped, self.angle_step)
+        mark = self.window.dirty_rects.mark
+        mark(self.rect)
+        center = self.rect.center
+        self.rect = self._image.get_rect()
+        self.rect.center = center
+        mark(self.rect)
+        
     def rotate(self, angle: float, image_rotate: bool = True):
-        x, y = self.rect.x, self.rect.y
         self.angle = angle
         if image_rotate:
-            self.image = pg.transform.rotate(self.image, angle)
-            self.rect = self.image.get_rect()
-            self.rect.x, self.rect.y = x, y
+            self._transform()
+            
+    def zoom(self, scale: float):
+        self.scale = scale
+        self._transform()
+        
+    def flip(self, horizontal: bool = False, vertical: bool = False):
+        self.flipped = horizontal, vertical
+        self._transform()
+        
+    def prebake(self, buckets: int = 36):
+        # Renders every angle bucket now, later rotations snap to the buckets and only look them up
+        self.angle_step = transforms.prebake(self.source, buckets, self.scale, self.flipped)
 
     def when_click_me(self, func: Callable[[], Any]):
         self._when_click_me = func
+        self.window.keep_events(pg.MOUSEBUTTONDOWN)
         
-    def collide(self, sprite: pg.sprite.Sprite):
-        return self.rect.colliderect(sprite.rect)
+    def collide(self, sprite: pg.sprite.Sprite, precise: bool = False):
+        # Masks are only compared once the rects overlap
+        if not self.rect.colliderect(sprite.rect):
+            return False
+        if not precise:
+            return True
+        offset = sprite.rect.x - self.rect.x, sprite.rect.y - self.rect.y
+        return get_mask(self.image).overlap(get_mask(sprite.image), offset) is not None
     
-    def collide_point(self, point: Tuple[int, int]):
-        return self.rect.collidepoint(to_pygame(point))
+    def collide_point(self, point: Tuple[int, int], precise: bool = False):
+        x, y = to_pygame(point)
+        if not self.rect.collidepoint(x, y):
+            return False
+        return not precise or bool(get_mask(self.image).get_at((x - self.rect.x, y - self.rect.y)))
     
     def collide_mouse(self):
-        return self.rect.collidepoint(pg.mouse.get_pos())
+        camera = self.window.camera
+        if camera and self not in camera.fixed:
+            return self.rect.collidepoint(camera.to_world(get_pos()))
+        return self.rect.collidepoint(get_pos())
 
     def collide_left_edge(self):
         return self.rect.left <= 0
@@ -104,10 +190,13 @@ class Sprite(pg.sprite.Sprite):
     def collide_edge(self):
         return self.collide_left_edge() or self.collide_right_edge() or self.collide_top_edge() or self.collide_bottom_edge()
     
-    def show(self):
-        self.screen.blit(self.image, self.rect)
+    def check_click(self):
         if self.window.event.mouse_down and self.collide_mouse():
             self._when_click_me()
+    
+    def show(self):
+        self.window.dirty_rects.mark_drawn(self.window.blit(self.image, self.rect))
+        self.check_click()
         
     update = show
     
@@ -116,8 +205,11 @@ class Sprite(pg.sprite.Sprite):
         self.pos = self.x + length * math.cos(angle), self.y - length * math.sin(angle)
 
     def rebound_if_collide_edge(self):
-        if self.collide_edge():
-            self.rotate(self.angle)
+        # The direction is mirrored on the edge that was hit
+        if self.collide_left_edge() or self.collide_right_edge():
+            self.rotate(180 - self.angle)
+        if self.collide_top_edge() or self.collide_bottom_edge():
+            self.rotate(-self.angle)
             
     rice = rebound_if_collide_edge
     
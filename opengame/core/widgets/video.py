@@ -10,6 +10,8 @@ from ...exceptions import not_created_window, OpenGameError, OpenGameWarning
 
 
 class Video(pg.sprite.Sprite):
+    blit_only = True
+    
     def __init__(self, video_path: Union[int, str] = 0, size: Optional[Tuple[int, int]] = None,
                  auto_set_fps: bool = True, warned: bool = True):
         if not saver.window:
@@ -48,7 +50,10 @@ class Video(pg.sprite.Sprite):
         self.window.fps = self.fps
         
     def resize(self, width: int, height: int):
+        mark = self.window.dirty_rects.mark
+        mark(self.rect)
         self.rect.width, self.rect.height = width, height
+        mark(self.rect)
         self.width, self.height = width, height
         self.size = self.width, self.height
 
@@ -58,7 +63,10 @@ class Video(pg.sprite.Sprite):
 
     @pos.setter
     def pos(self, pos: Tuple[int, int]):
+        mark = self.window.dirty_rects.mark
+        mark(self.rect)
         self.rect.centerx, self.rect.centery = to_pygame(pos)
+        mark(self.rect)
 
     @property
     def x(self):
@@ -76,14 +84,14 @@ class Video(pg.sprite.Sprite):
     def y(self, y: int):
         self.pos = self.x, y
 
-    def pack(self):
-        self.window.add(self)
+    def pack(self, layer: Optional[int] = None):
+        self.window.add(self, layer)
 
     def unpack(self):
         self.window.sprites.remove(self)
         
     def show(self):
-        self.screen.blit(self.image, self.rect)
+        self.window.dirty_rects.mark_drawn(self.window.blit(self.image, self.rect))
         
     def read(self, quit_if_over: bool = False, raise_if_over: bool = False, *args, **kwargs):
         ret, frame = self.video.read()
@@ -98,3 +106,4 @@ class Video(pg.sprite.Sprite):
                 raise OpenGameError('video play over')
             self.video.release()
             self.image = self.last
+        self.window.dirty_rects.mark(self.rect)
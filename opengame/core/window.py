@@ -1,6 +1,9 @@
 import os
 import sys
-from typing import Tuple, Optional, Union, Callable, Any
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Optional, Union, Callable, Any, Dict, Sequence
 
 try:
     os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
@@ -10,14 +13,54 @@ except ImportError:
     raise ImportError('pygame missing') from None
 
 from .event import Event
+from .dirty import DirtyRects
+from .profiler import Profiler
+from .registry import SpriteRegistry
+from .replay import InputRecorder, InputReplay
+from .handlers import Handlers
+from .scene import SceneStack
+from .pacing import Pacer, modes
+from .tasks import BackgroundScheduler
+from .workers import WorkerPools, WORKER_DONE, pools
+from .bands import BandRenderer
+from .viewport import Camera2D
 from .saver import saver
 from .mouse import Mouse
+from .coordinate import Transform
 from .style import styles, Style
 from .color import ColorType
 from ..exceptions import OpenGameError
 
 
-__all__ = ['Window']
+__all__ = ['Window', 'redraws']
+
+# Never blocked by the event filter, the window handles them itself
+_WINDOW_EVENTS = frozenset((QUIT, VIDEORESIZE, VIDEOEXPOSE, ACTIVEEVENT, WINDOWSHOWN, WINDOWHIDDEN, WINDOWEXPOSED,
+                            WINDOWMINIMIZED, WINDOWRESTORED, WINDOWFOCUSGAINED, WINDOWFOCUSLOST, WINDOWCLOSE,
+                            WORKER_DONE))
+_REDRAW_TIMEOUT = 250  # Longest wait for an event in on demand mode, in milliseconds
+
+# Event type -> new (focused, minimized) from the current state
+_FOCUS_EVENTS = {
+    WINDOWFOCUSGAINED: lambda focused, minimized: (True, minimized),
+    WINDOWFOCUSLOST: lambda focused, minimized: (False, minimized),
+    WINDOWMINIMIZED: lambda focused, minimized: (focused, True),
+    WINDOWHIDDEN: lambda focused, minimized: (focused, True),
+    WINDOWRESTORED: lambda focused, minimized: (focused, False),
+    WINDOWSHOWN: lambda focused, minimized: (focused, False),
+}
+
+
+def _coalesce(events):
+    # A run of motion events becomes one event with the last position and the summed movement
+    res = []
+    for event in events:
+        if event.type == MOUSEMOTION and res and res[-1].type == MOUSEMOTION:
+            last = res[-1]
+            res[-1] = pg.event.Event(MOUSEMOTION, event.dict, rel=(last.rel[0] + event.rel[0], last.rel[1] + event.rel[1]))
+        else:
+            res.append(event)
+    return res
 
 
 def _init_all():
@@ -26,13 +69,33 @@ def _init_all():
     pg.font.init()
     
     
+def _init_headless():
+    # Only the drivers of this initialization are replaced, windows created later open normally
+    environ = {name: os.environ.get(name) for name in ('SDL_VIDEODRIVER', 'SDL_AUDIODRIVER')}
+    os.environ['SDL_VIDEODRIVER'] = os.environ['SDL_AUDIODRIVER'] = 'dummy'
+    try:
+        _init_all()
+    finally:
+        for name, value in environ.items():
+            if value is None:
+                del os.environ[name]
+            else:
+                os.environ[name] = value
+    
+    
 _DEFAULT_ICON = os.path.join(os.path.dirname(__file__), 'favicon.png')
 
 
-class Window(object):
+class redraws(object):
+    always = 'always'  # Render every frame
+    on_demand = 'on_demand'  # Render after invalidate(), handled input or widget changes
+
+
+class Window(Handlers):
     def __init__(self, title: str = 'OpenGame Window', size: Tuple[int, int] = (480, 360), style: Style = styles.normal,
                  favicon: Optional[str] = _DEFAULT_ICON, fps: Union[int, float] = 60, on_center: bool = False,
-                 window_pos: Optional[Tuple[int, int]] = None, depth: int = 0, vsync: bool = False):
+                 window_pos: Optional[Tuple[int, int]] = None, depth: int = 0, vsync: bool = False,
+                 headless: bool = False):
         if on_center:
             os.environ['SDL_VIDEO_CENTERED'] = '1'
         if window_pos:
@@ -40,45 +103,145 @@ class Window(object):
             os.environ['SDL_VIDEO_WINDOW_POS'] = f'{x},{y}'
             del x, y
             
-        _init_all()
+        self.headless = headless
+        if headless:
+            _init_headless()
+        else:
+            _init_all()
         
+        self.dirty_rects = DirtyRects(self)
+        self.render_scale = self.max_render_scale = self.min_render_scale = 1
+        self.smooth = False
+        self.auto_scale = False
+        self._scale_checked = 0
+        self._scaler = None  # Camera2D drawing the sprites onto the scaled canvas
         self.set_mode(size, style, depth, vsync)
         pg.display.set_caption(title)
         
-        if favicon:
+        if favicon and not headless:
             icon = pg.image.load(favicon)
             pg.display.set_icon(icon)
         
         self.clock = pg.time.Clock()
         self.fps = fps
-        self.event = Event()
+        self.pacer = Pacer(self)
+        self.scheduler = BackgroundScheduler(self)
+        self.workers = WorkerPools(self)
+        self._event = Event()
+        self._raw_event = None
         self.mouse = Mouse()
-        self.sprites = []
+        self.sprites = SpriteRegistry()
         self.counter = 0
+        self.steps = 0
+        self.alpha = 0.0
+        self.profiler = None
+        self.recorder = None
+        self.replay = None
+        self._tasks = None  # Pending handler coroutines while run_async() is running
+        self._task_error = None
+        self.coalesce_motion = True
+        self.focused = True
+        self.minimized = False
+        self.background_fps = None  # Frame rate while idle, None keeps the normal rate
+        self.pause_audio = False
+        self._event_filter = None  # Event types allowed besides the handled ones, None when not filtering
+        self._kept_events = set()
+        self._capture_pool = None
+        self.band_renderer = None
+        self.camera = None
+        self._escape_quit = False
+        self._invalid = True
+        self._redraw_states = None
         
         self._key_down = self._text_input = self._text_editing = False
         self._key = None
         self._text = self._start = self._content = None
         
-        _empty_func = lambda: None
-        self._when_mouse_down = _empty_func
-        self._when_mouse_up = _empty_func
-        self._when_key_down = _empty_func
-        self._when_key_up = _empty_func
-        self._when_mouse_move = _empty_func
+        _empty_func = lambda *args: None
         self._when_draw = _empty_func
-        self._when_resize = _empty_func
-        self._when_active = _empty_func
+        self._when_update = _empty_func
+        # Event type -> tuple of (handler, whether it takes the raw event)
+        self._handlers: Dict[int, tuple] = {}
         
+        self.scenes = SceneStack(self)
         saver.window = self
         
     def set_mode(self, size: Tuple[int, int], style: Style = styles.normal, depth: int = 0, vsync: bool = False):
-        self.width, self.height = size
         self.style = style
         self.depth = depth
         self.vsync = vsync
-        self.screen = pg.display.set_mode(size, flags=style.style, depth=depth, vsync=vsync)
-        self.screen_rect = self.screen.get_rect()
+        self.display = pg.display.set_mode(size, flags=style.style, depth=depth, vsync=vsync)
+        self._set_canvas()
+        
+    def _set_canvas(self):
+        # Coordinates always use the window size. With a render scale the window draws onto a smaller
+        # offscreen canvas, mapping positions and images onto it, and upscales the canvas onto the display
+        width, height = self.display.get_size()
+        if self.render_scale == 1:
+            self.screen = self.display
+            self._scaler = None
+        else:
+            size = max(1, round(width * self.render_scale)), max(1, round(height * self.render_scale))
+            self.screen = pg.Surface(size).convert()
+            if self._scaler is None:
+                self._scaler = Camera2D(window=self)
+        self.width, self.height = width, height
+        self.screen_rect = self.display.get_rect()
+        self.transform = Transform(self.screen_rect.center)
+        self.dirty_rects.full = True
+        
+    def set_render_scale(self, scale: float = 1, smooth: bool = False, auto: bool = False, min_scale: float = 0.5):
+        # With auto the scale drops towards min_scale while frames run over budget, and climbs back to scale
+        if not 0 < min_scale <= 1 or not 0 < scale <= 1:
+            raise OpenGameError('render scale must be in (0, 1]')
+        self.render_scale = self.max_render_scale = scale
+        self.min_render_scale = min(min_scale, scale)
+        self.smooth = smooth
+        self.auto_scale = auto
+        self._scale_checked = self.counter
+        self._set_canvas()
+        
+    def _adapt_scale(self, interval: int = 30, step: float = 0.25):
+        # Checked every interval frames, so each decision sees frames rendered at the current scale
+        if self.counter - self._scale_checked < interval:
+            return
+        self._scale_checked = self.counter
+        load = self.pacer.load(interval)
+        scale = self.render_scale
+        if load > 1 and scale > self.min_render_scale:
+            scale = max(self.min_render_scale, scale - step)
+        elif load < 0.6 and scale < self.max_render_scale:
+            scale = min(self.max_render_scale, scale + step)
+        else:
+            return
+        self.render_scale = scale
+        self._set_canvas()
+        
+    def blit(self, image: pg.Surface, rect):
+        # Widgets blit at their rect in window pixels, which is mapped onto the canvas when it is scaled
+        if self._scaler is None:
+            return self.screen.blit(image, rect)
+        scale = self.render_scale
+        self.screen.blit(self._scaler.scaled(image, scale), (round(rect[0] * scale), round(rect[1] * scale)))
+        return pg.Rect(rect[0], rect[1], *image.get_size())
+        
+    def canvas_rect(self, rect):
+        # A rect in window pixels, as drawn on the canvas
+        rect = pg.Rect(rect)
+        if self._scaler is None:
+            return rect
+        scale = self.render_scale
+        return pg.Rect(round(rect.x * scale), round(rect.y * scale), round(rect.w * scale), round(rect.h * scale))
+        
+    def _dirty_active(self, dirty: bool):
+        # The camera and the scaled canvas always repaint the whole screen
+        return dirty and self.camera is None and self._scaler is None
+        
+    def _present(self):
+        if self.smooth:
+            pg.transform.smoothscale(self.screen, self.display.get_size(), self.display)
+        else:
+            pg.transform.scale(self.screen, self.display.get_size(), self.display)
         
     def resize(self, width: int, height: int):
         self.set_mode((width, height), self.style, self.depth, self.vsync)
@@ -97,83 +260,380 @@ class Window(object):
     def update():
         pg.display.update()
         
-    def show(self, status: int = 0, escape_quit: bool = False, quit_disable: bool = False):
-        while True:
-            self.screen.fill((255, 255, 255))
-            for sprite in self.sprites:
-                sprite.show()
-            self._when_draw()
+    def show(self, status: int = 0, escape_quit: bool = False, quit_disable: bool = False,
+             dirty: bool = False, fixed_update: bool = False, step: float = 1 / 120, max_steps: int = 5,
+             max_frames: Optional[int] = None, tick: bool = True, redraw: str = redraws.always):
+        for _ in self._frames(status, escape_quit, quit_disable, dirty, fixed_update, step, max_steps, max_frames,
+                              redraw, tick):
+            self.pacer.wait(tick)
+        return self.counter
+    
+    async def run_async(self, status: int = 0, escape_quit: bool = False, quit_disable: bool = False,
+                        dirty: bool = False, fixed_update: bool = False, step: float = 1 / 120,
+                        max_steps: int = 5, max_frames: Optional[int] = None, tick: bool = True,
+                        redraw: str = redraws.always):
+        self._tasks = set()
+        self._task_error = None
+        deadline = time.perf_counter()
+        try:
+            # Blocking for events would stall the other coroutines, the sleep below paces on demand mode
+            for res in self._frames(status, escape_quit, quit_disable, dirty, fixed_update, step, max_steps, max_frames,
+                                    redraw, False):
+                if asyncio.iscoroutine(res):
+                    # when_update and when_draw coroutines finish inside the frame, before it is presented
+                    await res
+                    continue
+                if self._task_error:
+                    raise self._task_error
+                now = time.perf_counter()
+                fps = self.pacer.fps
+                if tick and fps:
+                    if len(self.scheduler):
+                        self.scheduler.run(max(deadline + 1 / fps, now))
+                        now = time.perf_counter()
+                    # Sleeping until the deadline lets other coroutines run, instead of blocking in clock.tick
+                    deadline = max(deadline + 1 / fps, now)
+                    await asyncio.sleep(deadline - now)
+                else:
+                    await asyncio.sleep(0)
+                self.clock.tick()
+                self.pacer.wait(False, not (tick and fps))
+        finally:
+            tasks, self._tasks = self._tasks, None
+            for task in tasks:
+                task.cancel()
+            # Failures of handlers still running are reported instead of lost with the loop
+            for res in await asyncio.gather(*tasks, return_exceptions=True):
+                if isinstance(res, Exception) and self._task_error is None:
+                    self._task_error = res
+        if self._task_error:
+            raise self._task_error
+        return self.counter
+    
+    def _spawn(self, coro):
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        
+    def _task_done(self, task):
+        if self._tasks is not None:
+            self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None and self._task_error is None:
+            self._task_error = task.exception()
+    
+    def _frames(self, status: int = 0, escape_quit: bool = False, quit_disable: bool = False,
+                dirty: bool = False, fixed_update: bool = False, step: float = 1 / 120, max_steps: int = 5,
+                max_frames: Optional[int] = None, redraw: str = redraws.always, block: bool = True):
+        # Yields once per frame, right where the caller should wait for the next one,
+        # under run_async() it also yields handler coroutines, which must be awaited before going on
+        if redraw not in (redraws.always, redraws.on_demand):
+            raise OpenGameError(f'unknown redraw mode {redraw!r}')
+        on_demand = redraw == redraws.on_demand
+        self._invalid = True
+        self._redraw_states = None
+        self.dirty_rects.enable(dirty)
+        self.pacer.reset()
+        if self._escape_quit != escape_quit:
+            self._escape_quit = escape_quit
+            self._handlers_changed()
+        accumulator = 0.0
+        previous = time.perf_counter()
+        frames = 0
+        while max_frames is None or frames < max_frames:
+            if self.replay and self.replay.done(self.counter):
+                self.replay = None
+                break
+            profiler = self.profiler
+            if profiler:
+                profiler.start_frame()
+            if on_demand:
+                # Input comes first, so the frame it invalidates is rendered right away
+                events = self._wait_redraw(step * 1000 if fixed_update else _REDRAW_TIMEOUT, block)
+                self._pump_events(status, escape_quit, quit_disable, events)
+                if profiler:
+                    profiler.lap('events')
+            if fixed_update:
+                now = time.perf_counter()
+                if self.replay:
+                    # Replays run at full speed, the recorded frame times give the same steps
+                    elapsed = self.replay.frame_time(self.counter)
+                else:
+                    # Limit the catch-up after a slow frame, or the loop would never recover
+                    elapsed = min(now - previous, step * max_steps)
+                    if self.recorder:
+                        self.recorder.write_frame_time(self.counter, elapsed)
+                accumulator += elapsed
+                previous = now
+                while accumulator >= step:
+                    res = self._call('when_update', self._when_update)
+                    if self._tasks is not None and asyncio.iscoroutine(res):
+                        yield res
+                    self.steps += 1
+                    accumulator -= step
+                self.alpha = accumulator / step
+                if profiler:
+                    profiler.lap('update')
             
-            for event in pg.event.get():
-                if event.type == QUIT and (not quit_disable):
-                    self.destroy(status)
-                if escape_quit and event.type == KEYDOWN:
-                    if event.key == K_ESCAPE:
-                        self.destroy(status)
-                    self._key_down = True
-                    self._key = event.key
-                if event.type == TEXTEDITING:
-                    self._text_editing = True
-                    self._text = event.text
-                    self._start = event.start
-                if event.type == TEXTINPUT:
-                    self._text_input = True
-                    self._content = event.text
-                self.event_handler(event)
+            # Skipped frames still run the logic, when_draw only counts as rendering in fixed update mode
+            skip = self.pacer.skip or self.minimized
+            if on_demand and not skip:
+                skip = not (self._sprites_changed() or self._invalid)
+                if not skip:
+                    self._invalid = False
+            if self.auto_scale and not skip:
+                self._adapt_scale()
+            if not skip:
+                self._render(dirty)
+            # In fixed update mode when_draw interpolates with window.alpha
+            if not (fixed_update or on_demand) or not skip:
+                res = self._call('when_draw', self._when_draw)
+            else:
+                res = None
+            if self._tasks is not None and asyncio.iscoroutine(res):
+                yield res
+            if profiler:
+                profiler.lap('draw')
+            if not on_demand:
+                self._pump_events(status, escape_quit, quit_disable)
+            if profiler:
+                if not on_demand:
+                    profiler.lap('events')
+                if profiler.overlay:
+                    profiler.draw_overlay()
+                    profiler.lap('overlay')
             
-            self.update()
+            if not skip:
+                if self.screen is not self.display and not self.headless:
+                    self._present()
+                if self._dirty_active(dirty):
+                    self.dirty_rects.present()
+                else:
+                    if dirty:
+                        self.dirty_rects.reset()
+                    if not self.headless:
+                        self.update()
+            if profiler:
+                profiler.lap('display')
             self.counter += 1
-            self.clock.tick(self.fps)
-
-    def when_mouse_down(self, func: Callable[[], Any]):
-        self._when_mouse_down = func
-
-    def when_mouse_up(self, func: Callable[[], Any]):
-        self._when_mouse_up = func
-
-    def when_mouse_move(self, func: Callable[[], Any]):
-        self._when_mouse_move = func
-
-    def when_key_down(self, func: Callable[[], Any]):
-        self._when_key_down = func
-
-    def when_key_up(self, func: Callable[[], Any]):
-        self._when_key_up = func
-
-    def when_draw(self, func: Callable[[], Any]):
-        self._when_draw = func
-
-    def when_resize(self, func: Callable[[], Any]):
-        self._when_resize = func
-
-    def when_active(self, func: Callable[[], Any]):
-        self._when_active = func
+            frames += 1
+            yield frames
+            if profiler:
+                profiler.lap('tick')
+                profiler.end_frame()
+            
+    def schedule_background(self, generator_fn: Union[Callable[[], Any], Any], priority: int = 0,
+                            name: Optional[str] = None):
+        # Generators are resumed on this thread in the time left before each frame deadline
+        return self.scheduler.add(generator_fn, priority, name)
+        
+    def run_in_worker(self, func: Callable[..., Any], *args, pool: str = pools.thread,
+                      callback: Optional[Callable[[Any], Any]] = None, **kwargs):
+        # The callback runs on this thread when the WORKER_DONE event is pumped, handlers may subscribe to it too
+        return self.workers.submit(func, args, kwargs, pool, callback)
+        
+    def set_camera(self, camera: Optional[Camera2D] = None):
+        # Dirty rects and band rendering are not used while a camera is set
+        self.camera = camera
+        self.dirty_rects.full = True
+        return camera
+        
+    def parallel_render(self, enabled: bool = True, bands: Optional[int] = None, threads: Optional[int] = None):
+        # Only the full repaint is split into bands, dirty mode already draws little
+        if self.band_renderer:
+            self.band_renderer.shutdown()
+        self.band_renderer = BandRenderer(self, bands, threads) if enabled else None
+        return self.band_renderer
+        
+    def invalidate(self):
+        self._invalid = True
+        
+    def _sprites_changed(self):
+        states = {sprite: (tuple(sprite.rect), getattr(sprite, 'image', None)) for sprite in self.sprites.sprites()}
+        changed = states != self._redraw_states
+        self._redraw_states = states
+        return changed
+    
+    def _wait_redraw(self, timeout: float, block: bool = True):
+        # Blocks until an event arrives, so static screens leave the CPU alone
+        if self._invalid or not block or self.replay:
+            return ()
+        event = pg.event.wait(int(timeout))
+        self.pacer.rest()
+        return () if event.type == NOEVENT else (event, )
+        
+    def _render(self, dirty: bool = False):
+        profiler = self.profiler
+        if self._dirty_active(dirty):
+            self.dirty_rects.repaint(self.sprites.sprites())
+            if profiler:
+                profiler.lap('repaint')
+            return
+        runs = self.sprites.runs()
+        camera = self.camera or self._scaler
+        if camera:
+            camera.render(runs)
+        elif self.band_renderer:
+            self.band_renderer.render(runs)
+        else:
+            self.screen.fill((255, 255, 255))
+            if profiler:
+                profiler.lap('fill')
+            blits = self.screen.blits
+            for run in runs:
+                if type(run) is tuple:
+                    blits([(sprite.image, sprite.rect) for sprite in run], doreturn=False)
+                else:
+                    run.show()
+        # Batched sprites skipped their show(), so clicks are checked here
+        if self._raw_event is not None and self._raw_event.type == MOUSEBUTTONDOWN:
+            for run in runs:
+                if type(run) is tuple:
+                    for sprite in run:
+                        check_click = getattr(sprite, 'check_click', None)
+                        if check_click:
+                            check_click()
+        if profiler:
+            profiler.lap('sprites')
+            
+    def _call(self, name: str, func: Callable[..., Any], *args):
+        if self.profiler:
+            return self.profiler.call(name, func, *args)
+        return func(*args)
+        
+    def record_input(self, file: str = 'input.ogr', seed: Optional[int] = None):
+        self.stop_recording()
+        self.recorder = InputRecorder(file, self.counter, seed)
+        return self.recorder
+    
+    def stop_recording(self):
+        if self.recorder:
+            self.recorder.close()
+            self.recorder = None
+    
+    def replay_input(self, file: str = 'input.ogr'):
+        self.replay = InputReplay(file, self.counter)
+        return self.replay
+        
+    def pacing(self, mode: str = modes.tick, frame_skip: bool = False, max_skip: int = 2,
+               adaptive: bool = False, min_fps: float = 30, patience: int = 30, history: int = 240):
+        self.pacer = Pacer(self, mode, frame_skip, max_skip, adaptive, min_fps, patience, history)
+        return self.pacer
+    
+    @property
+    def frame_times(self):
+        return list(self.pacer.history)
         
-    set_mouse_down = when_mouse_down
-    set_mouse_up = when_mouse_up
-    set_mouse_move = when_mouse_move
-    set_key_down = when_key_down
-    set_key_up = when_key_up
-    set_draw = when_draw
-    set_resize = when_resize
-    set_active = when_active
+    def profile(self, enabled: bool = True, overlay: bool = False, history: int = 600):
+        self.profiler = Profiler(self, overlay, history) if enabled else None
+        return self.profiler
+            
+    @property
+    def idle(self):
+        return self.minimized or not self.focused
+    
+    def power_saving(self, background_fps: Optional[float] = 5, pause_audio: bool = False):
+        # While unfocused or minimized the loop runs at background_fps, minimized windows never render
+        self.background_fps = background_fps
+        self.pause_audio = pause_audio
+        
+    def _set_idle(self, focused: bool, minimized: bool):
+        idle = self.idle
+        self.focused, self.minimized = focused, minimized
+        if self.idle == idle:
+            return
+        if self.pause_audio and pg.mixer.get_init():
+            if self.idle:
+                pg.mixer.pause()
+            else:
+                pg.mixer.unpause()
+        if not self.idle:
+            self.pacer.reset()
+            self.dirty_rects.full = True
+        
+    def filter_events(self, enabled: bool = True, keep: Sequence[int] = ()):
+        # Only event types with handlers, kept types and window events reach the queue
+        # The SDL allow and block state is only reset when filtering is switched off, blocks set by the game stay
+        if not enabled and self._event_filter is not None:
+            pg.event.set_allowed(None)
+        self._event_filter = set(keep) if enabled else None
+        self._handlers_changed()
+        
+    def keep_events(self, *event_types: int):
+        # Widgets that read window.event call this, so filtering does not starve them
+        self._kept_events.update(event_types)
+        if self._event_filter is not None:
+            self._handlers_changed()
+        
+    def _handlers_changed(self):
+        if self._event_filter is None:
+            return
+        allowed = _WINDOW_EVENTS | self._event_filter | self._kept_events | set(self._handlers)
+        if self._escape_quit:
+            allowed.add(KEYDOWN)
+        pg.event.set_blocked(None)
+        pg.event.set_allowed(list(allowed))
+        
+    def _pump_events(self, status: int = 0, escape_quit: bool = False, quit_disable: bool = False,
+                     events: Sequence[pg.event.Event] = ()):
+        events = [*events, *pg.event.get()]
+        if self.replay:
+            # Live input is dropped, the log already holds everything the recorded session received.
+            # Worker results are not input, they still arrive live and keep their future
+            events = [*self.replay.get(self.counter), *(event for event in events if event.type == WORKER_DONE)]
+        elif self.recorder:
+            self.recorder.write(self.counter, [event for event in events if event.type != WORKER_DONE])
+        if self.coalesce_motion and len(events) > 1:
+            events = _coalesce(events)
+        for event in events:
+            if event.type == QUIT and (not quit_disable):
+                self.destroy(status)
+            if escape_quit and event.type == KEYDOWN:
+                if event.key == K_ESCAPE:
+                    self.destroy(status)
+                self._key_down = True
+                self._key = event.key
+            if event.type == TEXTEDITING:
+                self._text_editing = True
+                self._text = event.text
+                self._start = event.start
+            if event.type == TEXTINPUT:
+                self._text_input = True
+                self._content = event.text
+            if event.type == WORKER_DONE:
+                self.workers.finish(event)
+            if event.type in _FOCUS_EVENTS:
+                self._set_idle(*_FOCUS_EVENTS[event.type](self.focused, self.minimized))
+            if event.type in self._handlers or event.type in self._kept_events or event.type in _WINDOW_EVENTS:
+                self._invalid = True
+            self.event_handler(event)
+
+    @property
+    def event(self):
+        # The wrapper is only built when someone asks for it
+        if self._event is None:
+            self._event = Event(self._raw_event)
+        return self._event
 
     def event_handler(self, event: pg.event.Event):
-        self.event = Event(event)
-        if self.event.mouse_down:
-            self._when_mouse_down()
-        elif self.event.mouse_up:
-            self._when_mouse_up()
-        elif self.event.key_up:
-            self._when_key_up()
-        elif self.event.key_down:
-            self._when_key_down()
-        elif self.event.mouse_moving:
-            self._when_mouse_move()
-        elif self.event.resizing:
-            self._when_resize()
-        elif self.event.active:
-            self._when_active()
+        self._raw_event = event
+        self._event = None
+        handlers = self._handlers.get(event.type)
+        if not handlers:
+            return
+        if self.profiler:
+            name = pg.event.event_name(event.type)
+            for func, with_event in handlers:
+                if with_event:
+                    res = self.profiler.call(name, func, event)
+                else:
+                    res = self.profiler.call(name, func)
+                if res is not None and self._tasks is not None and asyncio.iscoroutine(res):
+                    self._spawn(res)
+            return
+        for func, with_event in handlers:
+            res = func(event) if with_event else func()
+            if res is not None and self._tasks is not None and asyncio.iscoroutine(res):
+                self._spawn(res)
             
     @property
     def hwnd(self):
@@ -192,17 +652,34 @@ class Window(object):
         
     def clear(self):
         self.screen.fill((255, 255, 255))
+        self.dirty_rects.mark_drawn(self.screen_rect)
         
     def rates(self, mod: int):
         return self.counter % mod == 0
     
-    def add(self, sprite):
-        self.sprites.append(sprite)
+    def step_rates(self, mod: int):
+        return self.steps % mod == 0
+    
+    def add(self, sprite, layer: Optional[int] = None):
+        self.sprites.add(sprite, layer=layer)
+        
+    def mark_dirty(self, *rects):
+        for rect in rects:
+            self.dirty_rects.mark(rect)
 
     def screenshot(self, file: str = 'screenshot.png'):
         pg.image.save(self.screen, file)
         return file
     
+    def snapshot(self):
+        return self.screen.copy()
+    
+    def screenshot_async(self, file: str = 'screenshot.png'):
+        # Only the copy happens in this frame, encoding and writing run on a worker thread
+        if self._capture_pool is None:
+            self._capture_pool = ThreadPoolExecutor(1, 'opengame-screenshot')
+        return self._capture_pool.submit(pg.image.save, self.screen.copy(), file)
+    
     def entry_options(self):
         res = (self._key_down, self._text_editing, self._text_input,
                self._key, self._text, self._start, self._content)
@@ -213,3 +690,4 @@ class Window(object):
     
     def fill(self, color: ColorType):
         self.screen.fill(color)
+        self.dirty_rects.mark_drawn(self.screen_rect)
@@ -0,0 +1,106 @@
+import os
+import time
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor, ProcessPoolExecutor
+from typing import Optional, Callable, Any
+
+import pygame as pg
+
+from ..exceptions import OpenGameError
+
+__all__ = ['WORKER_DONE', 'pools', 'WorkerPools']
+
+WORKER_DONE = pg.event.custom_type()
+
+
+class pools(object):
+    thread = 'thread'  # For calls that wait on IO or release the GIL
+    process = 'process'  # For pure Python number crunching, arguments and results must be picklable
+
+
+def _timed(func: Callable[..., Any], args: tuple, kwargs: dict):
+    # Runs in the worker, module level so process pools can pickle it
+    started = time.time()
+    start = time.perf_counter()
+    res = func(*args, **kwargs)
+    return res, started, time.perf_counter() - start
+
+
+class WorkerPools(object):
+    def __init__(self, window, threads: Optional[int] = None, processes: Optional[int] = None):
+        self.window = window
+        self.threads = threads or min(4, os.cpu_count() or 1)
+        self.processes = processes or max(1, (os.cpu_count() or 2) - 1)
+        self.pending = set()
+        self._thread_pool = None
+        self._process_pool = None
+        self._callbacks = {}
+
+    def __str__(self):
+        return f'WorkerPools(threads={self.threads}, processes={self.processes}, pending={len(self.pending)})'
+
+    def _pool(self, pool: str):
+        if pool == pools.thread:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(self.threads, 'opengame-worker')
+            return self._thread_pool
+        if pool == pools.process:
+            if self._process_pool is None:
+                self._process_pool = ProcessPoolExecutor(self.processes)
+            return self._process_pool
+        raise OpenGameError(f'unknown worker pool {pool!r}')
+
+    def submit(self, func: Callable[..., Any], args: tuple = (), kwargs: Optional[dict] = None,
+               pool: str = pools.thread, callback: Optional[Callable[[Any], Any]] = None):
+        future = Future()
+        future.name = getattr(func, '__name__', 'task')
+        future.submitted = time.time()
+        future.queued = future.elapsed = None  # Seconds waiting for a worker and seconds running
+        inner = self._pool(pool).submit(_timed, func, args, kwargs or {})
+        future.add_done_callback(lambda _: future.cancelled() and inner.cancel())
+        inner.add_done_callback(lambda _: self._done(future, inner))
+        self.pending.add(future)
+        if callback is not None:
+            self._callbacks[future] = callback
+        return future
+
+    def _done(self, future: Future, inner: Future):
+        # Runs on a worker thread, the result reaches the main thread through the SDL event queue
+        # Once running, the outer future cannot be cancelled while the result is set
+        if future.set_running_or_notify_cancel():
+            if inner.cancelled():
+                future.set_exception(CancelledError())
+            elif inner.exception() is not None:
+                future.set_exception(inner.exception())
+            else:
+                res, started, future.elapsed = inner.result()
+                future.queued = max(0.0, started - future.submitted)
+                future.set_result(res)
+        try:
+            pg.event.post(pg.event.Event(WORKER_DONE, future=future))
+        except pg.error:
+            pass  # The window is already closed
+
+    def finish(self, event: pg.event.Event):
+        # Called on the main thread for each WORKER_DONE event
+        future = getattr(event, 'future', None)
+        if future is None:
+            return
+        self.pending.discard(future)
+        callback = self._callbacks.pop(future, None)
+        if callback is None or future.cancelled():
+            return
+        if future.exception() is not None:
+            raise future.exception()
+        callback(future.result())
+
+    def cancel_all(self):
+        for future in list(self.pending):
+            future.cancel()
+
+    def shutdown(self, wait: bool = True, cancel: bool = False):
+        if cancel:
+            self.cancel_all()
+        for executor in (self._thread_pool, self._process_pool):
+            if executor is not None:
+                executor.shutdown(wait)
+        self._thread_pool = self._process_pool = None
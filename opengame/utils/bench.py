@@ -0,0 +1,221 @@
+import os
+import sys
+import json
+import time
+import socket
+import runpy
+import argparse
+import platform
+import tempfile
+from threading import Thread
+from typing import Callable, Any, Optional, List
+
+import pygame as pg
+
+__all__ = ['run', 'main', 'EXAMPLES']
+
+EXAMPLES = ['snake', 'carrace', 'fiveinrow', 'lighting']
+
+
+def _measure(name: str, func: Callable[[], Any], number: int = 1000, repeat: int = 5,
+             setup: Optional[Callable[[], Any]] = None, **info):
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return {
+        'name': name,
+        'number': number,
+        'repeat': repeat,
+        'best_us': min(times) * 1e6,
+        'mean_us': sum(times) / len(times) * 1e6,
+        **info,
+    }
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def _render(og, window, count: int, frames: int, dirty: bool = False):
+    window.sprites.empty()
+    og.random.seed(count)
+    for _ in range(count):
+        sprite = og.Sprite(og.builtin.sprites.apple, (24, 24))
+        sprite.pos = og.random.randint(-220, 220), og.random.randint(-160, 160)
+        sprite.pack()
+    start = time.perf_counter()
+    window.show(max_frames=frames, tick=False, dirty=dirty)
+    seconds = time.perf_counter() - start
+    window.sprites.empty()
+    name = f'render_{"dirty_" if dirty else ""}{count}_sprites'
+    return {'name': name, 'number': frames, 'repeat': 1, 'best_us': seconds / frames * 1e6,
+            'mean_us': seconds / frames * 1e6, 'sprites': count}
+
+
+def _video(og):
+    try:
+        import cv2
+        import numpy as np
+    except ImportError:
+        return None
+    path = os.path.join(tempfile.mkdtemp(), 'bench.avi')
+    writer = cv2.VideoWriter(path, cv2.VideoWriter_fourcc(*'MJPG'), 30, (320, 240))
+    for i in range(61):
+        writer.write(np.full((240, 320, 3), i * 4 % 256, dtype=np.uint8))
+    writer.release()
+    video = []
+
+    def setup():
+        video[:] = [og.Video(path, auto_set_fps=False)]
+
+    return _measure('video_read', lambda: video[0].read(), number=50, repeat=3, setup=setup)
+
+
+def _round_trip(og):
+    port = _free_port()
+    server = og.cs.Server(port=port)
+
+    @server.when_user
+    def echo(user):
+        while True:
+            data = user.get()
+            if not data:
+                break
+            user.send(data)
+
+    server.sock.listen(1)  # Listen before the thread starts, so the client cannot connect too early
+    Thread(target=server.run, daemon=True).start()
+    client = og.cs.Client(port=port)
+
+    def ping():
+        client.send('ping')
+        client.get()
+
+    try:
+        return _measure('cs_round_trip', ping, number=200, repeat=3)
+    finally:
+        client.close()
+
+
+def micro(frames: int = 120):
+    import opengame as og
+
+    window = og.Window('OpenGame Benchmark', (480, 360), headless=True)
+    results = []
+    for count in (100, 1000):
+        results.append(_render(og, window, count, frames))
+    results.append(_render(og, window, 1000, frames, dirty=True))
+
+    label = og.Label('Score: 0')
+    results.append(_measure('label_set_text', lambda: label.set_text('Score: 100'), number=2000))
+    results.append(_measure('to_pygame', lambda: og.math.to_pygame((12, 34)), number=100000))
+    results.append(_measure('to_opengame', lambda: og.math.to_opengame((12, 34)), number=100000))
+
+    sprite = og.Sprite(og.builtin.sprites.apple, (60, 60))
+    image = sprite.image
+
+    def rotate():
+        sprite.image = image
+        sprite.rotate(30)
+
+    results.append(_measure('sprite_rotate', rotate, number=2000))
+    results.append(_measure('sprite_clone', sprite.clone, number=500))
+
+    pen = og.Pen()
+    points = [(0, 0), (40, 10), (30, 50), (-20, 40)]
+    results.append(_measure('pen_circle', lambda: pen.circle((255, 0, 0), (10, 10), 20), number=5000))
+    results.append(_measure('pen_rect', lambda: pen.rect((255, 0, 0), (10, 10), (20, 20)), number=5000))
+    results.append(_measure('pen_line', lambda: pen.line((255, 0, 0), (-50, 10), (50, 20)), number=5000))
+    results.append(_measure('pen_polygon', lambda: pen.polygon((255, 0, 0), points), number=5000))
+
+    board = og.math.get_blank_board(0, 20)
+    for i in range(2, 7):
+        board[i][i] = 1
+    results.append(_measure('maths_in_row', lambda: og.math.in_row(board, (4, 4), player=1), number=2000))
+    lights = [[1] * 8 for _ in range(8)]
+    results.append(_measure('maths_lighting_game', lambda: og.math.lighting_game(lights), number=20))
+
+    for res in (_video(og), _round_trip(og)):
+        if res:
+            results.append(res)
+    return results
+
+
+def _with_defaults(func: Callable, **defaults):
+    def wrapper(*args, **kwargs):
+        return func(*args, **{**defaults, **kwargs})
+
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def macro(frames: int = 300, examples: Optional[List[str]] = None):
+    import opengame as og
+
+    results = []
+    # The examples are unmodified games, so run them headless and untimed for a fixed number of frames
+    window = og.Window
+    originals = {name: window.__dict__[name] for name in ('__init__', 'show', 'run_async')}
+    window.__init__ = _with_defaults(originals['__init__'], headless=True)
+    window.show = _with_defaults(originals['show'], max_frames=frames, tick=False)
+    window.run_async = _with_defaults(originals['run_async'], max_frames=frames, tick=False)
+    try:
+        for example in examples or EXAMPLES:
+            og.random.seed(0)
+            note = None
+            start = time.perf_counter()
+            try:
+                runpy.run_module(f'opengame.utils.examples.{example}', run_name='__main__')
+            except (SystemExit, pg.error) as err:
+                # Game over screens quit the first window, so the old loop stops there
+                note = str(err)
+            seconds = time.perf_counter() - start
+            results.append({'name': f'example_{example}', 'frames': frames, 'seconds': seconds,
+                            'frame_us': seconds / frames * 1e6, 'note': note})
+    finally:
+        for name, func in originals.items():
+            setattr(window, name, func)
+    return results
+
+
+def run(frames: int = 300, include_macro: bool = True):
+    from ..version import get_string
+
+    results = micro(max(frames // 2, 1))
+    if include_macro:
+        results += macro(frames)
+    return {
+        'opengame': get_string(),
+        'pygame': pg.version.ver,
+        'sdl': '.'.join(map(str, pg.get_sdl_version())),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'results': results,
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(prog='python -m opengame bench', description='Run OpenGame benchmarks.')
+    parser.add_argument('-o', '--output', help='write the JSON result to this file')
+    parser.add_argument('-f', '--frames', type=int, default=300, help='frames for each example')
+    parser.add_argument('--no-macro', action='store_true', help='skip the example games')
+    args = parser.parse_args(argv)
+
+    result = json.dumps(run(args.frames, not args.no_macro), indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(result)
+    else:
+        print(result)
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -20,10 +20,9 @@ def draw():
         i.show()
         if i.collide_bottom_edge():
             bombs.remove(i)
-        if player.collide(i):
+        if player.collide(i, precise=True):
             og.play_sound(og.builtin.sounds.bomb)
-            window.screenshot('temp.png')
-            game_over(i.pos)
+            game_over(i.pos, window.snapshot())
     if window.rates(30):
         s = bomb.clone()
         s.pos = og.random.choice((-135, 0, 135)), og.random.randint(160, 350)
@@ -43,10 +42,10 @@ def key_down():
         track_idx += 1
         player.x += 115
         
-def game_over(pos):
+def game_over(pos, last_frame):
     window.destroy(exit_all=False)
     new_win = og.Window('Game Over', (400, 710))
-    back = og.Background('temp.png')
+    back = og.Background(last_frame)
     back.pack()
     over = og.Sprite(og.builtin.sprites.gameover1)
     over.pack()
@@ -31,10 +31,10 @@ player = BLACK
 
 def destroy(tips):
     update()
-    window.screenshot()
+    last_frame = window.snapshot()
     window.destroy(exit_all=False)
     new_win = og.Window('Game Over', (WIDTH, WIDTH))
-    bg = og.Background('screenshot.png')
+    bg = og.Background(last_frame)
     bg.pack()
     label = og.Label(tips, font=og.Font.from_system('msmincho', 52, True), color=(0, 255, 0))
     label.pack()
@@ -89,4 +89,4 @@ def mouse_down():
 
 
 if __name__ == '__main__':
-    window.show()
+    window.show(redraw='on_demand')
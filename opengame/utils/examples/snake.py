@@ -20,9 +20,9 @@ def game_over():
     ) or (body.count(body[0]) > 1 and window.counter > 10 and flag)
 
 
-def show_over():
+def show_over(last_frame):
     win = og.Window('Game Over', (800, 600))
-    og.Background('temp.png').pack()
+    og.Background(last_frame).pack()
     win.show()
 
 
@@ -66,10 +66,10 @@ def draw():
         flag = False
             
     if game_over():
-        window.screenshot('temp.png')
+        last_frame = window.snapshot()
         window.destroy(exit_all=False)
         
-        show_over()
+        show_over(last_frame)
     
 
 @window.when_key_down
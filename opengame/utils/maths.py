@@ -12,14 +12,14 @@ from collections import deque
 
 from pygame.math import Vector2, Vector3, enable_swizzling, disable_swizzling
 
-from ..core.coordinate import CoordinateType, parse, to_pygame, to_opengame
+from ..core.coordinate import CoordinateType, parse, to_pygame, to_opengame, to_pygame_many, to_opengame_many
 from ..exceptions import OpenGameError
 
 __all__ = ['flatten', 'chunk', 'transpose', 'duplicate_removal', 'distance', 'Vector2',
            'Vector3', 'swizzling', 'mean', 'get_rc_grid', 'get_rc_rect', 'in_row',
            'get_peripheries', 'get_blank_board', 'lighting_game', 'find', 'random_captcha',
            'to_pygame', 'to_opengame', 'deque', 'switch', 'random', 'random_strings',
-           'choiceof', 'inv_sqrt', 'integer_log2']
+           'choiceof', 'inv_sqrt', 'integer_log2', 'to_pygame_many', 'to_opengame_many']
 
 
 def flatten(array: list):
@@ -6,53 +6,86 @@ import pygame.gfxdraw as gfx
 from ..core.saver import saver
 from ..exceptions import not_created_window
 from ..core.color import ColorType
-from ..core.coordinate import to_pygame, CoordinateType
+from ..core.coordinate import to_pygame, to_pygame_many, CoordinateType
 
 
 class Pen(object):
     def __init__(self):
         if not saver.window:
             raise not_created_window
-        self.screen = saver.window.screen
+        self.window = saver.window
+        self._mark = self.window.dirty_rects.mark_drawn
+        
+    @property
+    def screen(self):
+        # The canvas is replaced when the render scale changes
+        return self.window.screen
+        
+    def _point(self, pos: CoordinateType):
+        # Window pixels onto the canvas, the same as to_pygame() without a render scale
+        x, y = to_pygame(pos)
+        scale = self.window.render_scale
+        if scale == 1:
+            return x, y
+        return round(x * scale), round(y * scale)
+    
+    def _length(self, length: int):
+        scale = self.window.render_scale
+        if scale == 1 or not length:
+            return length
+        return max(1, round(length * scale))
         
     def circle(self, color: ColorType, center: CoordinateType, radius: int = 30,
                fill: bool = True, width: int = 1):
         if fill:
             width = 0
-        pg.draw.circle(self.screen, color, to_pygame(center), radius, width=width)
+        self._mark(pg.draw.circle(self.screen, color, self._point(center), self._length(radius),
+                                  width=self._length(width)))
         
     def rect(self, color: ColorType, left_top: CoordinateType, size: Tuple[int, int],
              fill: bool = True, width: int = 1):
         if fill:
             width = 0
-        pg.draw.rect(self.screen, color, pg.rect.Rect(to_pygame(left_top), size), width=width)
+        rect = self.window.canvas_rect((to_pygame(left_top), size))
+        self._mark(pg.draw.rect(self.screen, color, rect, width=self._length(width)))
     
     rectangle = rect
     
     def line(self, color: ColorType, start: CoordinateType, end: CoordinateType,
              width: int = 1):
-        pg.draw.aaline(self.screen, color, to_pygame(start), to_pygame(end), width)
+        self._mark(pg.draw.aaline(self.screen, color, self._point(start), self._point(end), self._length(width)))
         
     def polygon(self, color: ColorType, points: List[CoordinateType], fill: bool = True, width: int = 1):
         if fill:
             width = 0
-        points = [to_pygame(p) for p in points]
-        pg.draw.polygon(self.screen, color, points, width=width)
+        if hasattr(points, 'shape'):
+            # NumPy arrays are converted in one call, lists are faster point by point
+            points = (to_pygame_many(points) * self.window.render_scale).tolist()
+        else:
+            points = [self._point(p) for p in points]
+        self._mark(pg.draw.polygon(self.screen, color, points, width=self._length(width)))
         
     def ellipse(self, color: ColorType, left_top: CoordinateType, size: Tuple[int, int],
                 fill: bool = True, width: int = 1):
         if fill:
             width = 0
-        pg.draw.ellipse(self.screen, color, pg.rect.Rect(to_pygame(left_top), size), width=width)
+        rect = self.window.canvas_rect((to_pygame(left_top), size))
+        self._mark(pg.draw.ellipse(self.screen, color, rect, width=self._length(width)))
         
     def arc(self, color: ColorType, point: CoordinateType, radius: int, start_degree: float, stop_degree: float):
-        x, y = to_pygame(point)
+        x, y = self._point(point)
+        radius = self._length(radius)
         gfx.arc(self.screen, x, y, radius, start_degree, stop_degree, color)
+        self._mark((x - radius, y - radius, radius * 2 + 1, radius * 2 + 1))
 
     def pie(self, color: ColorType, point: CoordinateType, radius: int, start_degree: float, stop_degree: float):
-        x, y = to_pygame(point)
+        x, y = self._point(point)
+        radius = self._length(radius)
         gfx.pie(self.screen, x, y, radius, start_degree, stop_degree, color)
+        self._mark((x - radius, y - radius, radius * 2 + 1, radius * 2 + 1))
         
     def bezier(self, color: ColorType, points: List[CoordinateType], steps: int = 10):
-        points = [to_pygame(p) for p in points]
+        points = [self._point(p) for p in points]
         gfx.bezier(self.screen, points, steps, color)
+        xs, ys = [x for x, _ in points], [y for _, y in points]
+        self._mark((min(xs), min(ys), max(xs) - min(xs) + 1, max(ys) - min(ys) + 1))
@@ -1,9 +1,11 @@
-from typing import Optional, Tuple
+import warnings
+from typing import Optional, Tuple, Union
 
 import cv2
+import pygame as pg
 
 from ..core.saver import saver
-from ..exceptions import not_created_window
+from ..exceptions import not_created_window, OpenGameWarning
 
 __all__ = ['encodings', 'Screencap']
 
@@ -30,9 +32,18 @@ class Screencap(object):
         self.window = saver.window
         self.images = []
         
-    def record(self, temp_file: str = 'temp.png'):
-        self.window.screenshot(temp_file)
-        array = cv2.imread(temp_file)
+    def record(self, image: Optional[Union[str, pg.Surface]] = None, temp_file: Optional[str] = None):
+        # Frames are copied from memory, a path keeps the old behaviour of saving and reading that file
+        if temp_file is not None:
+            warnings.warn('temp_file is deprecated, pass the path as image', OpenGameWarning)
+            image = temp_file
+        if isinstance(image, str):
+            self.window.screenshot(image)
+            array = cv2.imread(image)
+        else:
+            if image is None:
+                image = self.window.screen
+            array = cv2.cvtColor(pg.surfarray.array3d(image).swapaxes(0, 1), cv2.COLOR_RGB2BGR)
         self.images.append(array)
         
     def save(self, video_path: str = 'screencap.avi', encoding: str = encodings.I420,